@@ -0,0 +1,39 @@
+"""add project issue stats
+
+Revision ID: 4f8a2d6c1e93
+Revises: c9d41e7a2f63
+Create Date: 2026-10-18 13:41:52.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f8a2d6c1e93'
+down_revision: Union[str, None] = 'c9d41e7a2f63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('project_issue_stats',
+    sa.Column('project_id', sa.UUID(), nullable=False),
+    sa.Column('status', postgresql.ENUM('open', 'in_progress', 'resolved', 'closed', 'reopened', name='issuestatus', create_type=False), nullable=False),
+    sa.Column('priority', postgresql.ENUM('low', 'medium', 'high', 'critical', name='issuepriority', create_type=False), nullable=False),
+    sa.Column('count', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('project_id', 'status', 'priority')
+    )
+    op.execute(
+        "INSERT INTO project_issue_stats (project_id, status, priority, count) "
+        "SELECT project_id, status, priority, count(*) FROM issues "
+        "GROUP BY project_id, status, priority"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('project_issue_stats')
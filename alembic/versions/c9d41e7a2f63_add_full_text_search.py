@@ -0,0 +1,48 @@
+"""add full text search
+
+Revision ID: c9d41e7a2f63
+Revises: e5f0c3a1b8d2
+Create Date: 2026-10-18 13:12:08.447912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9d41e7a2f63'
+down_revision: Union[str, None] = 'e5f0c3a1b8d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('issues', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        nullable=True,
+    ))
+    op.create_index('ix_issues_search_vector', 'issues', ['search_vector'], unique=False, postgresql_using='gin')
+
+    op.add_column('comments', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed("to_tsvector('english', coalesce(content, ''))", persisted=True),
+        nullable=True,
+    ))
+    op.create_index('ix_comments_search_vector', 'comments', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_comments_search_vector', table_name='comments', postgresql_using='gin')
+    op.drop_column('comments', 'search_vector')
+    op.drop_index('ix_issues_search_vector', table_name='issues', postgresql_using='gin')
+    op.drop_column('issues', 'search_vector')
@@ -0,0 +1,37 @@
+"""add token blacklist expires_at
+
+Revision ID: e5f0c3a1b8d2
+Revises: b7e2a91c4d50
+Create Date: 2026-10-18 12:05:39.861442
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f0c3a1b8d2'
+down_revision: Union[str, None] = 'b7e2a91c4d50'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('token_blacklist', sa.Column('expires_at', sa.DateTime(timezone=True), nullable=True))
+    # Existing rows never recorded their token's exp; the refresh token
+    # lifetime (7 days by default) is the longest any of them can be valid.
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("UPDATE token_blacklist SET expires_at = datetime(created_at, '+7 days')")
+    else:
+        op.execute("UPDATE token_blacklist SET expires_at = created_at + interval '7 days'")
+    # SQLite can't ALTER COLUMN; batch mode recreates the table there.
+    with op.batch_alter_table('token_blacklist') as batch_op:
+        batch_op.alter_column('expires_at', existing_type=sa.DateTime(timezone=True), nullable=False)
+    op.create_index(op.f('ix_token_blacklist_expires_at'), 'token_blacklist', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_token_blacklist_expires_at'), table_name='token_blacklist')
+    op.drop_column('token_blacklist', 'expires_at')
@@ -0,0 +1,158 @@
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.schemas.auth import (
+    RegisterRequest,
+    LoginRequest,
+    TokenResponse,
+    UserResponse,
+)
+from app.api.deps.auth import get_current_user_async
+from app.core import token_cache
+from app.core.jwt import create_access_token, create_refresh_token, decode_token
+from app.core.revocation import revocation_store
+from app.core.security import hash_password_async, verify_password_async
+from app.db.deps import get_async_db
+from app.models.user import User
+
+security = HTTPBearer()
+
+router = APIRouter(prefix="/api/auth", tags=["auth"])
+
+
+@router.post("/register", response_model=UserResponse, status_code=201)
+async def register_user(
+    payload: RegisterRequest,
+    db: AsyncSession = Depends(get_async_db),
+):
+    if await db.scalar(select(User.id).where(User.email == payload.email)):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered",
+        )
+
+    user = User(
+        username=payload.username,
+        email=payload.email,
+        password=await hash_password_async(payload.password),
+    )
+
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+
+    return UserResponse(
+        id=str(user.id),
+        username=user.username,
+        email=user.email,
+        role=user.role,
+    )
+
+@router.post("/login", response_model=TokenResponse)
+async def login_user(
+    payload: LoginRequest,
+    db: AsyncSession = Depends(get_async_db),
+):
+    user = await db.scalar(select(User).where(User.email == payload.email))
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid credentials",
+        )
+
+    valid, new_hash = await verify_password_async(payload.password, user.password)
+    if not valid:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid credentials",
+        )
+
+    if new_hash:
+        # Argon2 parameters changed since this hash was made.
+        user.password = new_hash
+        await db.commit()
+
+    access_token = create_access_token(
+        subject=str(user.id),
+        role=user.role,
+    )
+    refresh_token = create_refresh_token(subject=str(user.id))
+
+    return TokenResponse(
+        access_token=access_token,
+        refresh_token=refresh_token,
+    )
+
+
+@router.get("/me", response_model=UserResponse)
+async def get_me(current_user: User = Depends(get_current_user_async)):
+    return UserResponse(
+        id=str(current_user.id),
+        username=current_user.username,
+        email=current_user.email,
+        role=current_user.role,
+    )
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh_token(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db),
+):
+    token = credentials.credentials
+
+    try:
+        payload = decode_token(token)
+    except Exception:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    if payload.get("type") != "refresh":
+        raise HTTPException(status_code=401, detail="Invalid token type")
+
+    if await revocation_store.is_revoked_async(db, payload["jti"]):
+        raise HTTPException(status_code=401, detail="Token has been revoked")
+
+    user = await db.get(User, payload["sub"])
+
+    # blacklist old refresh token (rotation)
+    revocation_store.revoke(
+        db,
+        jti=payload["jti"],
+        token_type="refresh",
+        expires_at=datetime.fromtimestamp(payload["exp"], tz=timezone.utc),
+    )
+    await db.commit()
+
+    new_access = create_access_token(
+        subject=payload["sub"],
+        role=user.role,
+    )
+    new_refresh = create_refresh_token(subject=payload["sub"])
+
+    return TokenResponse(
+        access_token=new_access,
+        refresh_token=new_refresh,
+    )
+
+@router.post("/logout")
+async def logout(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db),
+):
+    token = credentials.credentials
+    payload = decode_token(token)
+
+    revocation_store.revoke(
+        db,
+        jti=payload["jti"],
+        token_type=payload["type"],
+        expires_at=datetime.fromtimestamp(payload["exp"], tz=timezone.utc),
+    )
+    await db.commit()
+
+    token_cache.invalidate_token(token)
+
+    return {"detail": "Successfully logged out"}
@@ -0,0 +1,103 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.schemas.comment import CommentCreate, CommentPage, CommentResponse
+from app.api.conditional import Validators, query_fingerprint
+from app.api.deps.auth import get_current_user_async
+from app.api.responses import ORJSONResponse
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.db.deps import get_async_db
+from app.models.comment import Comment
+from app.models.issue import Issue
+from app.models.user import User
+from app.services.changes import record_deletion
+from app.services.comments import (
+    adjust_comment_count,
+    comment_list_version_query,
+    comment_page,
+    comment_response,
+    list_comments_query,
+    queue_comment_event,
+)
+
+router = APIRouter(
+    prefix="/api/issues/{issue_id}/comments",
+    tags=["comments"],
+)
+
+@router.post("", response_model=CommentResponse, status_code=201)
+async def add_comment(
+    issue_id: str,
+    payload: CommentCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    issue = await db.get(Issue, issue_id)
+    if not issue:
+        raise HTTPException(status_code=404, detail="Issue not found")
+
+    comment = Comment(
+        content=payload.content,
+        issue_id=issue.id,
+        project_id=issue.project_id,
+        author_id=current_user.id,
+    )
+
+    db.add(comment)
+    await db.flush()
+    result = await db.execute(adjust_comment_count(issue.id, 1))
+    project_id = result.scalar_one()
+    queue_comment_event(db, "comment.added", project_id, comment)
+    await db.commit()
+    await db.refresh(comment)
+
+    return comment_response(comment)
+
+@router.get(
+    "",
+    response_model=CommentPage,
+    response_class=ORJSONResponse,
+)
+async def list_comments(
+    issue_id: str,
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    version = (await db.execute(comment_list_version_query(issue_id))).one()
+    validators = Validators.for_collection(
+        version.last_modified, version.count, issue_id, query_fingerprint(request)
+    )
+    if validators.is_fresh(request):
+        return validators.not_modified()
+
+    rows = (await db.execute(list_comments_query(issue_id, limit, cursor))).all()
+
+    return ORJSONResponse(
+        comment_page(rows, limit), headers=validators.headers()
+    )
+
+@router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_comment(
+    issue_id: str,
+    comment_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    comment = await db.get(Comment, comment_id)
+    if not comment or str(comment.issue_id) != issue_id:
+        raise HTTPException(status_code=404, detail="Comment not found")
+
+    if current_user.role != "admin" and comment.author_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not allowed")
+
+    await db.delete(comment)
+    result = await db.execute(adjust_comment_count(comment.issue_id, -1))
+    project_id = result.scalar_one()
+    queue_comment_event(db, "comment.deleted", project_id, comment)
+    record_deletion(
+        db, project_id, "comment", comment.id, issue_id=comment.issue_id
+    )
+    await db.commit()
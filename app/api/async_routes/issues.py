@@ -0,0 +1,165 @@
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.schemas.issue import (
+    IssueCreate,
+    IssueUpdate,
+    IssueResponse,
+    IssuePage,
+)
+from app.api.conditional import Validators, query_fingerprint
+from app.api.deps.auth import get_current_user_async
+from app.api.deps.issues import IssueListParams, issue_list_params
+from app.api.deps.permissions import require_roles_async
+from app.api.responses import ORJSONResponse
+from app.db.deps import get_async_db
+from app.models.issue import Issue
+from app.models.project import Project
+from app.models.user import User
+from app.services.issues import (
+    issue_list_version_query,
+    issue_page,
+    issue_response,
+    list_issues_query,
+    queue_issue_event,
+)
+from app.services.outbox import enqueue
+from app.services.stats import adjust_issue_stats, issue_stats_key
+
+router = APIRouter(
+    prefix="/api/issues",
+    tags=["issues"],
+)
+
+@router.post("", response_model=IssueResponse, status_code=201)
+async def create_issue(
+    payload: IssueCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    project = await db.get(Project, payload.project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    issue = Issue(
+        title=payload.title,
+        description=payload.description or "",
+        priority=payload.priority,
+        project_id=project.id,
+        reporter_id=current_user.id,
+    )
+
+    db.add(issue)
+    await db.flush()
+    await db.run_sync(adjust_issue_stats, added=[issue_stats_key(issue)])
+    queue_issue_event(db, "issue.created", issue)
+    enqueue(
+        db,
+        "issue.created",
+        {"issue_id": str(issue.id), "project_id": str(issue.project_id)},
+    )
+    await db.commit()
+    await db.refresh(issue)
+
+    return issue_response(issue)
+
+@router.get("", response_model=IssuePage, response_class=ORJSONResponse)
+async def list_issues(
+    request: Request,
+    params: IssueListParams = Depends(issue_list_params),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    version = (await db.execute(issue_list_version_query(params))).one()
+    validators = Validators.for_collection(
+        version.last_modified, version.count, query_fingerprint(request)
+    )
+    if validators.is_fresh(request):
+        return validators.not_modified()
+
+    rows = (await db.execute(list_issues_query(params))).all()
+
+    return ORJSONResponse(
+        issue_page(rows, params), headers=validators.headers()
+    )
+
+@router.put("/{issue_id}", response_model=IssueResponse)
+async def update_issue(
+    issue_id: str,
+    payload: IssueUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    issue = await db.get(Issue, issue_id)
+    if not issue:
+        raise HTTPException(status_code=404, detail="Issue not found")
+
+    if (
+        current_user.role not in ("admin", "manager")
+        and issue.assignee_id != current_user.id
+    ):
+        raise HTTPException(status_code=403, detail="Not allowed")
+
+    before = issue_stats_key(issue)
+    for field, value in payload.model_dump(exclude_unset=True).items():
+        setattr(issue, field, value)
+
+    await db.run_sync(
+        adjust_issue_stats, removed=[before], added=[issue_stats_key(issue)]
+    )
+    queue_issue_event(db, "issue.updated", issue)
+    await db.commit()
+    await db.refresh(issue)
+
+    return issue_response(issue)
+
+@router.post(
+    "/{issue_id}/assign/{user_id}",
+    dependencies=[Depends(require_roles_async("admin", "manager"))],
+)
+async def assign_issue(
+    issue_id: str,
+    user_id: str,
+    db: AsyncSession = Depends(get_async_db),
+):
+    issue = await db.get(Issue, issue_id)
+    if not issue:
+        raise HTTPException(status_code=404, detail="Issue not found")
+
+    user = await db.get(User, user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    issue.assignee_id = user.id
+    queue_issue_event(db, "issue.assigned", issue)
+    enqueue(
+        db,
+        "issue.assigned",
+        {"issue_id": str(issue.id), "assignee_id": str(user.id)},
+    )
+    await db.commit()
+
+    return {"detail": "Issue assigned"}
+
+@router.post(
+    "/{issue_id}/close",
+    dependencies=[Depends(require_roles_async("admin", "manager"))],
+)
+async def close_issue(
+    issue_id: str,
+    db: AsyncSession = Depends(get_async_db),
+):
+    issue = await db.get(Issue, issue_id)
+    if not issue:
+        raise HTTPException(status_code=404, detail="Issue not found")
+
+    before = issue_stats_key(issue)
+    issue.status = "closed"
+    await db.run_sync(
+        adjust_issue_stats, removed=[before], added=[issue_stats_key(issue)]
+    )
+    queue_issue_event(db, "issue.closed", issue)
+    enqueue(db, "issue.closed", {"issue_id": str(issue.id)})
+    await db.commit()
+
+    return {"detail": "Issue closed"}
@@ -0,0 +1,150 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.schemas.project import (
+    ProjectCreate,
+    ProjectUpdate,
+    ProjectResponse,
+)
+from app.api.conditional import Validators
+from app.api.deps.auth import get_current_user_async
+from app.api.deps.permissions import require_roles_async
+from app.api.responses import ORJSONResponse
+from app.core.cache import CachedResponse, response_cache
+from app.db.deps import get_async_db
+from app.models.project import Project
+from app.models.user import User
+from app.services.changes import record_deletion
+from app.services.projects import (
+    PROJECT_LIST_CACHE_KEY,
+    list_projects_query,
+    project_cache_key,
+    project_entry,
+    project_list_entry,
+    project_response,
+)
+from app.services.stats import clear_project_stats
+
+router = APIRouter(
+    prefix="/api/projects",
+    tags=["projects"],
+)
+
+@router.post(
+    "",
+    response_model=ProjectResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_roles_async("admin", "manager"))],
+)
+async def create_project(
+    payload: ProjectCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    project = Project(
+        name=payload.name,
+        description=payload.description,
+        created_by_id=current_user.id,
+    )
+
+    db.add(project)
+    await db.commit()
+    await db.refresh(project)
+    await response_cache.invalidate_async(PROJECT_LIST_CACHE_KEY)
+
+    return project_response(project)
+
+
+@router.get(
+    "",
+    response_model=list[ProjectResponse],
+    response_class=ORJSONResponse,
+)
+async def list_projects(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    async def load() -> CachedResponse:
+        rows = (await db.execute(list_projects_query())).all()
+        return project_list_entry(rows)
+
+    cached = await response_cache.get_or_set_async(
+        PROJECT_LIST_CACHE_KEY, load
+    )
+    return cached.to_response()
+
+@router.get(
+    "/{project_id}",
+    response_model=ProjectResponse,
+)
+async def get_project(
+    project_id: str,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    try:
+        key = project_cache_key(project_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    async def load() -> CachedResponse:
+        project = await db.get(Project, project_id)
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+        return project_entry(project)
+
+    cached = await response_cache.get_or_set_async(key, load)
+    validators = Validators.from_headers(cached.headers)
+    if validators.is_fresh(request):
+        return validators.not_modified()
+
+    return cached.to_response()
+
+@router.put(
+    "/{project_id}",
+    response_model=ProjectResponse,
+    dependencies=[Depends(require_roles_async("admin", "manager"))],
+)
+async def update_project(
+    project_id: str,
+    payload: ProjectUpdate,
+    db: AsyncSession = Depends(get_async_db),
+):
+    project = await db.get(Project, project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    if payload.name is not None:
+        project.name = payload.name
+    if payload.description is not None:
+        project.description = payload.description
+
+    await db.commit()
+    await db.refresh(project)
+    await response_cache.invalidate_async(
+        PROJECT_LIST_CACHE_KEY, project_cache_key(project.id)
+    )
+
+    return project_response(project)
+
+@router.delete(
+    "/{project_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(require_roles_async("admin"))],
+)
+async def delete_project(
+    project_id: str,
+    db: AsyncSession = Depends(get_async_db),
+):
+    project = await db.get(Project, project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    await db.run_sync(clear_project_stats, project.id)
+    record_deletion(db, project.id, "project", project.id)
+    await db.delete(project)
+    await db.commit()
+    await response_cache.invalidate_async(
+        PROJECT_LIST_CACHE_KEY, project_cache_key(project.id)
+    )
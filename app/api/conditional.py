@@ -0,0 +1,114 @@
+import hashlib
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, Response, status
+
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class Validators:
+    """Weak ETag and Last-Modified for a conditional GET.
+
+    Both are derived from a cheap version query (a primary-key lookup or
+    a ``count``/``max(updated_at)`` aggregate) so a 304 can be answered
+    without loading or serializing the response body.
+    """
+
+    etag: str
+    last_modified: datetime | None
+    # False while the version may still move behind our back; nothing is
+    # then sent or honoured, so clients simply refetch.
+    settled: bool = True
+
+    @classmethod
+    def build(cls, last_modified: datetime | None, *parts: Any) -> "Validators":
+        if last_modified is not None and last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+
+        digest = hashlib.blake2b(digest_size=12)
+        for part in (last_modified, *parts):
+            digest.update(str(part).encode())
+            digest.update(b"\0")
+        return cls(f'W/"{digest.hexdigest()}"', last_modified)
+
+    @classmethod
+    def for_collection(
+        cls, last_modified: datetime | None, count: int, *parts: Any
+    ) -> "Validators":
+        """``build`` from a ``count``/``max(updated_at)`` aggregate.
+
+        PostgreSQL stamps rows with their transaction's start time, so a
+        transaction that commits late can change a row without moving
+        either aggregate. Like the changes feed, trust the aggregate only
+        once its newest stamp is older than ``CHANGES_SETTLE_SECONDS``.
+        """
+        validators = cls.build(last_modified, count, *parts)
+        horizon = datetime.now(tz=timezone.utc) - timedelta(
+            seconds=settings.CHANGES_SETTLE_SECONDS
+        )
+        newest = validators.last_modified
+        if newest is not None and newest > horizon:
+            return replace(validators, settled=False)
+        return validators
+
+    @classmethod
+    def from_headers(cls, headers: dict[str, str]) -> "Validators":
+        last_modified = headers.get("Last-Modified")
+        return cls(
+            headers["ETag"],
+            parsedate_to_datetime(last_modified) if last_modified else None,
+        )
+
+    def headers(self) -> dict[str, str]:
+        if not self.settled:
+            return {"Cache-Control": "private, no-cache"}
+        headers = {"ETag": self.etag, "Cache-Control": "private, no-cache"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(
+                self.last_modified.astimezone(timezone.utc), usegmt=True
+            )
+        return headers
+
+    def is_fresh(self, request: Request) -> bool:
+        if not self.settled:
+            return False
+        # If-None-Match wins over If-Modified-Since when both are sent.
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            return self._etag_matches(if_none_match)
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is None or self.last_modified is None:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP dates have one-second resolution.
+        return self.last_modified.replace(microsecond=0) <= since
+
+    def _etag_matches(self, header: str) -> bool:
+        if header.strip() == "*":
+            return True
+        # Weak comparison: the W/ prefix is ignored on both sides.
+        ours = self.etag.removeprefix("W/")
+        return any(
+            tag.strip().removeprefix("W/") == ours for tag in header.split(",")
+        )
+
+    def not_modified(self) -> Response:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=self.headers(),
+        )
+
+
+def query_fingerprint(request: Request) -> str:
+    """Order-independent form of the query string, for collection ETags."""
+    return "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
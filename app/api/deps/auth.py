@@ -1,24 +1,19 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from app.core import token_cache
 from app.core.jwt import decode_token
-from app.db.deps import get_db
+from app.core.revocation import revocation_store
+from app.db.deps import get_async_db, get_db
 from app.models.user import User
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.models.token_blacklist import TokenBlacklist
-
 
 security = HTTPBearer()
 
 
-
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-) -> User:
-    token = credentials.credentials
-
+def _verify_access_token(token: str) -> dict:
     try:
         payload = decode_token(token)
     except Exception:
@@ -33,8 +28,39 @@ def get_current_user(
             detail="Invalid token type",
         )
 
+    return payload
+
+
+def _lookup_cached(token: str) -> token_cache.CachedToken | None:
+    cached = token_cache.lookup(token)
+    if cached is None:
+        return None
+
+    # The cache is per process, so a logout served by another worker
+    # never invalidated this entry. The in-memory Bloom filter does see
+    # it (after at most one revocation refresh) and costs no query; a
+    # possible hit falls back to the full, DB-confirmed check.
+    if revocation_store.might_be_revoked(cached.claims["jti"]):
+        token_cache.invalidate_token(token)
+        return None
+
+    return cached
+
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db),
+) -> User:
+    token = credentials.credentials
+
+    cached = _lookup_cached(token)
+    if cached is not None:
+        return db.merge(cached.to_user(), load=False)
+
+    payload = _verify_access_token(token)
+
     jti = payload.get("jti")
-    if db.query(TokenBlacklist).filter(TokenBlacklist.jti == jti).first():
+    if revocation_store.is_revoked(db, jti):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token has been revoked",
@@ -47,4 +73,37 @@ def get_current_user(
             detail="User not found or inactive",
         )
 
+    token_cache.remember(token, payload, user)
+
+    return user
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    token = credentials.credentials
+
+    cached = _lookup_cached(token)
+    if cached is not None:
+        return await db.merge(cached.to_user(), load=False)
+
+    payload = _verify_access_token(token)
+
+    jti = payload.get("jti")
+    if await revocation_store.is_revoked_async(db, jti):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+        )
+
+    user = await db.get(User, payload["sub"])
+    if not user or not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found or inactive",
+        )
+
+    token_cache.remember(token, payload, user)
+
     return user
@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import get_args
+
+from fastapi import Query
+
+from app.api.schemas.issue import IssueInclude, IssueSort
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.models.enums import IssuePriority, IssueStatus
+
+
+@dataclass
+class IssueListParams:
+    project_id: str
+    status: list[IssueStatus] | None
+    priority: list[IssuePriority] | None
+    assignee_id: str | None
+    reporter_id: str | None
+    due_after: date | None
+    due_before: date | None
+    sort: IssueSort
+    limit: int
+    cursor: str | None
+
+
+def issue_list_params(
+    project_id: str,
+    status_: list[IssueStatus] | None = Query(None, alias="status"),
+    priority: list[IssuePriority] | None = Query(None),
+    assignee_id: str | None = None,
+    reporter_id: str | None = None,
+    due_after: date | None = None,
+    due_before: date | None = None,
+    sort: IssueSort = "created_at",
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+) -> IssueListParams:
+    return IssueListParams(
+        project_id=project_id,
+        status=status_,
+        priority=priority,
+        assignee_id=assignee_id,
+        reporter_id=reporter_id,
+        due_after=due_after,
+        due_before=due_before,
+        sort=sort,
+        limit=limit,
+        cursor=cursor,
+    )
+
+
+def issue_includes(
+    include: list[IssueInclude] | None = Query(None),
+) -> set[str]:
+    if include is None:
+        return set(get_args(IssueInclude))
+    return set(include)
@@ -1,6 +1,6 @@
 from fastapi import Depends, HTTPException, status
 
-from app.api.deps.auth import get_current_user
+from app.api.deps.auth import get_current_user, get_current_user_async
 from app.models.user import User
 
 
@@ -14,3 +14,15 @@ def require_roles(*allowed_roles: str):
         return current_user
 
     return role_checker
+
+
+def require_roles_async(*allowed_roles: str):
+    async def role_checker(current_user: User = Depends(get_current_user_async)):
+        if current_user.role not in allowed_roles:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Insufficient permissions",
+            )
+        return current_user
+
+    return role_checker
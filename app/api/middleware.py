@@ -0,0 +1,116 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import Gauge, Histogram, track_phases
+from app.db.query_stats import track_queries
+
+REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Request latency by router.",
+    ("router",),
+)
+IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Requests currently being handled by router.",
+    ("router",),
+)
+PHASE_SECONDS = Histogram(
+    "http_request_phase_seconds",
+    "Time per request spent in jwt_decode, blacklist_lookup, "
+    "password_hash and db.",
+    ("router", "phase"),
+)
+DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "SQL statements issued per request.",
+    ("method", "route"),
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50, 100),
+)
+DB_SECONDS = Histogram(
+    "http_request_db_seconds",
+    "Time spent executing SQL statements per request.",
+    ("method", "route"),
+)
+
+
+API_ROUTERS = {"auth", "projects", "issues", "search", "users"}
+
+
+def router_label(path: str) -> str:
+    # Resolved from the path before routing so the in-flight gauge can
+    # be raised on entry. Unknown paths share one label to keep the
+    # series count bounded.
+    parts = path.split("/", 5)
+    if len(parts) > 2 and parts[1] == "api" and parts[2] in API_ROUTERS:
+        if parts[2] == "issues" and parts[4:5] == ["comments"]:
+            return "comments"
+        if parts[2] == "projects" and parts[4:5] == ["events"]:
+            # Long-lived streams; kept apart from the request latencies.
+            return "events"
+        return parts[2]
+    if len(parts) > 1 and parts[1] in ("metrics", "health"):
+        return parts[1]
+    return "other"
+
+
+def route_label(scope: Scope) -> str:
+    route = scope.get("route")
+    return route.path if route is not None else "unmatched"
+
+
+class RequestMetricsMiddleware:
+    """Records latency, in-flight requests and per-phase time per router.
+
+    Also counts and times the SQL each request issues, adding a
+    ``Server-Timing: db`` header and feeding the per-route histograms.
+    A pure ASGI middleware so the context variables it sets are visible
+    to the endpoint (and to the worker thread of a sync one).
+
+    ``benchmarks/middleware_overhead.py`` measures it at about 7us per
+    request on a 1-vCPU dev VM: roughly half is the extra ASGI layer and
+    send wrapper, the rest the five histogram and gauge updates and the
+    two context variables. Negligible next to any endpoint that queries
+    the database, but not free on a bare route.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        router = router_label(scope["path"])
+        IN_FLIGHT.inc(router)
+        start = time.perf_counter()
+
+        with track_queries() as stats, track_phases() as phases:
+
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    timing = b'db;dur=%.2f;desc="%d queries"' % (
+                        stats.duration * 1000,
+                        stats.count,
+                    )
+                    message["headers"] = [
+                        *message.get("headers", ()),
+                        (b"server-timing", timing),
+                    ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                IN_FLIGHT.dec(router)
+                REQUEST_SECONDS.observe(time.perf_counter() - start, router)
+
+                labels = (scope["method"], route_label(scope))
+                DB_QUERIES.observe(stats.count, *labels)
+                DB_SECONDS.observe(stats.duration, *labels)
+
+                if stats.count:
+                    PHASE_SECONDS.observe(stats.duration, router, "db")
+                for phase, seconds in phases.items():
+                    PHASE_SECONDS.observe(seconds, router, phase)
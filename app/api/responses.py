@@ -0,0 +1,17 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Returning one from a route skips FastAPI's ``response_model``
+    validation, so it is only used by list endpoints whose rows already
+    match the declared schema (UUIDs, enums and datetimes are serialized
+    natively by orjson).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
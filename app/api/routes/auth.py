@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
@@ -8,11 +10,12 @@ from app.api.schemas.auth import (
     TokenResponse,
     UserResponse,
 )
+from app.core import token_cache
 from app.core.jwt import create_access_token, create_refresh_token, decode_token
-from app.core.security import hash_password, verify_password
+from app.core.revocation import revocation_store
+from app.core.security import hash_password_pooled, verify_password_pooled
 from app.db.deps import get_db
 from app.models.user import User
-from app.models.token_blacklist import TokenBlacklist
 
 security = HTTPBearer()
 
@@ -30,7 +33,7 @@ def register_user(payload: RegisterRequest, db: Session = Depends(get_db)):
     user = User(
         username=payload.username,
         email=payload.email,
-        password=hash_password(payload.password),
+        password=hash_password_pooled(payload.password),
     )
 
     db.add(user)
@@ -47,13 +50,24 @@ def register_user(payload: RegisterRequest, db: Session = Depends(get_db)):
 @router.post("/login", response_model=TokenResponse)
 def login_user(payload: LoginRequest, db: Session = Depends(get_db)):
     user = db.query(User).filter(User.email == payload.email).first()
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid credentials",
+        )
 
-    if not user or not verify_password(payload.password, user.password):
+    valid, new_hash = verify_password_pooled(payload.password, user.password)
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
         )
 
+    if new_hash:
+        # Argon2 parameters changed since this hash was made.
+        user.password = new_hash
+        db.commit()
+
     access_token = create_access_token(
         subject=str(user.id),
         role=user.role,
@@ -66,6 +80,7 @@ def login_user(payload: LoginRequest, db: Session = Depends(get_db)):
     )
 
 from app.api.deps.auth import get_current_user
+from app.api.deps.permissions import require_roles
 
 
 @router.get("/me", response_model=UserResponse)
@@ -92,12 +107,15 @@ def refresh_token(
     if payload.get("type") != "refresh":
         raise HTTPException(status_code=401, detail="Invalid token type")
 
+    if revocation_store.is_revoked(db, payload["jti"]):
+        raise HTTPException(status_code=401, detail="Token has been revoked")
+
     # blacklist old refresh token (rotation)
-    db.add(
-        TokenBlacklist(
-            jti=payload["jti"],
-            token_type="refresh",
-        )
+    revocation_store.revoke(
+        db,
+        jti=payload["jti"],
+        token_type="refresh",
+        expires_at=datetime.fromtimestamp(payload["exp"], tz=timezone.utc),
     )
     db.commit()
 
@@ -120,13 +138,23 @@ def logout(
     token = credentials.credentials
     payload = decode_token(token)
 
-    db.add(
-        TokenBlacklist(
-            jti=payload["jti"],
-            token_type=payload["type"],
-        )
+    revocation_store.revoke(
+        db,
+        jti=payload["jti"],
+        token_type=payload["type"],
+        expires_at=datetime.fromtimestamp(payload["exp"], tz=timezone.utc),
     )
     db.commit()
 
+    token_cache.invalidate_token(token)
+
     return {"detail": "Successfully logged out"}
 
+
+@router.get(
+    "/token-cache",
+    dependencies=[Depends(require_roles("admin"))],
+)
+def token_cache_stats():
+    return token_cache.token_cache.stats()
+
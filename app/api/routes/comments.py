@@ -1,12 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
 
-from app.api.schemas.comment import CommentCreate, CommentResponse
+from app.api.schemas.comment import CommentCreate, CommentPage, CommentResponse
+from app.api.conditional import Validators, query_fingerprint
 from app.api.deps.auth import get_current_user
+from app.api.responses import ORJSONResponse
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from app.db.deps import get_db
 from app.models.comment import Comment
 from app.models.issue import Issue
 from app.models.user import User
+from app.services.changes import record_deletion
+from app.services.comments import (
+    adjust_comment_count,
+    comment_list_version_query,
+    comment_page,
+    comment_response,
+    list_comments_query,
+    queue_comment_event,
+)
 
 router = APIRouter(
     prefix="/api/issues/{issue_id}/comments",
@@ -27,37 +39,45 @@ def add_comment(
     comment = Comment(
         content=payload.content,
         issue_id=issue_id,
-        user_id=current_user.id,
+        project_id=issue.project_id,
+        author_id=current_user.id,
     )
 
     db.add(comment)
+    db.flush()
+    result = db.execute(adjust_comment_count(issue.id, 1))
+    project_id = result.scalar_one()
+    queue_comment_event(db, "comment.added", project_id, comment)
     db.commit()
     db.refresh(comment)
 
-    return CommentResponse(
-        id=str(comment.id),
-        content=comment.content,
-        issue_id=str(comment.issue_id),
-        user_id=str(comment.user_id),
-    )
+    return comment_response(comment)
 
-@router.get("", response_model=list[CommentResponse])
+@router.get(
+    "",
+    response_model=CommentPage,
+    response_class=ORJSONResponse,
+)
 def list_comments(
     issue_id: str,
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    comments = db.query(Comment).filter(Comment.issue_id == issue_id).all()
+    version = db.execute(comment_list_version_query(issue_id)).one()
+    validators = Validators.for_collection(
+        version.last_modified, version.count, issue_id, query_fingerprint(request)
+    )
+    if validators.is_fresh(request):
+        return validators.not_modified()
 
-    return [
-        CommentResponse(
-            id=str(c.id),
-            content=c.content,
-            issue_id=str(c.issue_id),
-            user_id=str(c.user_id),
-        )
-        for c in comments
-    ]
+    rows = db.execute(list_comments_query(issue_id, limit, cursor)).all()
+
+    return ORJSONResponse(
+        comment_page(rows, limit), headers=validators.headers()
+    )
 
 @router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_comment(
@@ -70,8 +90,14 @@ def delete_comment(
     if not comment or str(comment.issue_id) != issue_id:
         raise HTTPException(status_code=404, detail="Comment not found")
 
-    if current_user.role != "admin" and comment.user_id != current_user.id:
+    if current_user.role != "admin" and comment.author_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not allowed")
 
     db.delete(comment)
+    result = db.execute(adjust_comment_count(comment.issue_id, -1))
+    project_id = result.scalar_one()
+    queue_comment_event(db, "comment.deleted", project_id, comment)
+    record_deletion(
+        db, project_id, "comment", comment.id, issue_id=comment.issue_id
+    )
     db.commit()
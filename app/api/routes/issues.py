@@ -1,17 +1,49 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 
 from app.api.schemas.issue import (
+    BulkResult,
+    IssueBulkAssign,
+    IssueBulkCreate,
+    IssueBulkUpdate,
     IssueCreate,
     IssueUpdate,
+    IssueDetailResponse,
     IssueResponse,
+    IssuePage,
 )
+from app.api.conditional import Validators, query_fingerprint
 from app.api.deps.auth import get_current_user
+from app.api.deps.issues import (
+    IssueListParams,
+    issue_includes,
+    issue_list_params,
+)
 from app.api.deps.permissions import require_roles
+from app.api.responses import ORJSONResponse
 from app.db.deps import get_db
 from app.models.issue import Issue
 from app.models.project import Project
 from app.models.user import User
+from app.services.bulk import (
+    bulk_assign_issues,
+    bulk_create_issues,
+    bulk_update_issues,
+)
+from app.services.issues import (
+    issue_comments_query,
+    issue_detail,
+    issue_detail_query,
+    issue_list_version_query,
+    issue_page,
+    issue_response,
+    list_issues_query,
+    queue_issue_event,
+)
+from app.services.outbox import enqueue
+from app.services.stats import adjust_issue_stats, issue_stats_key
 
 router = APIRouter(
     prefix="/api/issues",
@@ -30,48 +62,62 @@ def create_issue(
 
     issue = Issue(
         title=payload.title,
-        description=payload.description,
+        description=payload.description or "",
         priority=payload.priority,
         project_id=payload.project_id,
-        created_by_id=current_user.id,
+        reporter_id=current_user.id,
     )
 
     db.add(issue)
+    db.flush()
+    adjust_issue_stats(db, added=[issue_stats_key(issue)])
+    queue_issue_event(db, "issue.created", issue)
+    enqueue(
+        db,
+        "issue.created",
+        {"issue_id": str(issue.id), "project_id": str(issue.project_id)},
+    )
     db.commit()
     db.refresh(issue)
 
-    return IssueResponse(
-        id=str(issue.id),
-        title=issue.title,
-        description=issue.description,
-        status=issue.status,
-        priority=issue.priority,
-        project_id=str(issue.project_id),
-        created_by_id=str(issue.created_by_id),
-        assignee_id=str(issue.assignee_id) if issue.assignee_id else None,
-    )
+    return issue_response(issue)
 
-@router.get("", response_model=list[IssueResponse])
+@router.get("", response_model=IssuePage, response_class=ORJSONResponse)
 def list_issues(
-    project_id: str,
+    request: Request,
+    params: IssueListParams = Depends(issue_list_params),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    issues = db.query(Issue).filter(Issue.project_id == project_id).all()
-
-    return [
-        IssueResponse(
-            id=str(i.id),
-            title=i.title,
-            description=i.description,
-            status=i.status,
-            priority=i.priority,
-            project_id=str(i.project_id),
-            created_by_id=str(i.created_by_id),
-            assignee_id=str(i.assignee_id) if i.assignee_id else None,
-        )
-        for i in issues
-    ]
+    version = db.execute(issue_list_version_query(params)).one()
+    validators = Validators.for_collection(
+        version.last_modified, version.count, query_fingerprint(request)
+    )
+    if validators.is_fresh(request):
+        return validators.not_modified()
+
+    rows = db.execute(list_issues_query(params)).all()
+
+    return ORJSONResponse(
+        issue_page(rows, params), headers=validators.headers()
+    )
+
+@router.get("/{issue_id}", response_model=IssueDetailResponse)
+def get_issue(
+    issue_id: uuid.UUID,
+    include: set[str] = Depends(issue_includes),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    issue = db.scalars(issue_detail_query(issue_id, include)).unique().first()
+    if not issue:
+        raise HTTPException(status_code=404, detail="Issue not found")
+
+    comments = None
+    if "comments" in include:
+        comments = db.scalars(issue_comments_query(issue_id)).unique().all()
+
+    return issue_detail(issue, include, comments)
 
 @router.put("/{issue_id}", response_model=IssueResponse)
 def update_issue(
@@ -90,22 +136,16 @@ def update_issue(
     ):
         raise HTTPException(status_code=403, detail="Not allowed")
 
+    before = issue_stats_key(issue)
     for field, value in payload.dict(exclude_unset=True).items():
         setattr(issue, field, value)
 
+    adjust_issue_stats(db, removed=[before], added=[issue_stats_key(issue)])
+    queue_issue_event(db, "issue.updated", issue)
     db.commit()
     db.refresh(issue)
 
-    return IssueResponse(
-        id=str(issue.id),
-        title=issue.title,
-        description=issue.description,
-        status=issue.status,
-        priority=issue.priority,
-        project_id=str(issue.project_id),
-        created_by_id=str(issue.created_by_id),
-        assignee_id=str(issue.assignee_id) if issue.assignee_id else None,
-    )
+    return issue_response(issue)
 
 @router.post(
     "/{issue_id}/assign/{user_id}",
@@ -125,6 +165,12 @@ def assign_issue(
         raise HTTPException(status_code=404, detail="User not found")
 
     issue.assignee_id = user.id
+    queue_issue_event(db, "issue.assigned", issue)
+    enqueue(
+        db,
+        "issue.assigned",
+        {"issue_id": str(issue.id), "assignee_id": str(user.id)},
+    )
     db.commit()
 
     return {"detail": "Issue assigned"}
@@ -141,7 +187,38 @@ def close_issue(
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
 
+    before = issue_stats_key(issue)
     issue.status = "closed"
+    adjust_issue_stats(db, removed=[before], added=[issue_stats_key(issue)])
+    queue_issue_event(db, "issue.closed", issue)
+    enqueue(db, "issue.closed", {"issue_id": str(issue.id)})
     db.commit()
 
     return {"detail": "Issue closed"}
+
+@router.post("/bulk/create", response_model=BulkResult)
+def bulk_create(
+    payload: IssueBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return bulk_create_issues(db, payload.items, reporter_id=current_user.id)
+
+@router.post("/bulk/update", response_model=BulkResult)
+def bulk_update(
+    payload: IssueBulkUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return bulk_update_issues(db, payload.items, current_user)
+
+@router.post(
+    "/bulk/assign",
+    response_model=BulkResult,
+    dependencies=[Depends(require_roles("admin", "manager"))],
+)
+def bulk_assign(
+    payload: IssueBulkAssign,
+    db: Session = Depends(get_db),
+):
+    return bulk_assign_issues(db, payload.items)
@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from app.api.deps.permissions import require_roles
+
+from app.core.cache import response_cache
+from app.core.events import event_broker
+from app.core.user_cache import user_cache
+from app.core.metrics import render_metrics
+from app.db.pool import pool_stats
+from app.db.session import async_engine, engine
+
+router = APIRouter(
+    prefix="/metrics",
+    tags=["metrics"],
+)
+
+
+@router.get("", response_class=PlainTextResponse)
+def prometheus_metrics():
+    return PlainTextResponse(
+        render_metrics(), media_type="text/plain; version=0.0.4"
+    )
+
+
+@router.get(
+    "/db-pool",
+    dependencies=[Depends(require_roles("admin"))],
+)
+def db_pool_metrics():
+    pools = {"sync": pool_stats(engine)}
+    if async_engine is not None:
+        pools["async"] = pool_stats(async_engine.sync_engine)
+    return pools
+
+
+@router.get(
+    "/response-cache",
+    dependencies=[Depends(require_roles("admin"))],
+)
+def response_cache_metrics():
+    return response_cache.stats()
+
+
+@router.get(
+    "/user-cache",
+    dependencies=[Depends(require_roles("admin"))],
+)
+def user_cache_metrics():
+    return user_cache.stats()
+
+
+@router.get(
+    "/events",
+    dependencies=[Depends(require_roles("admin"))],
+)
+def events_metrics():
+    return event_broker.stats()
@@ -1,16 +1,61 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import uuid
+from typing import Literal
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.api.schemas.changes import ProjectChanges
 from app.api.schemas.project import (
     ProjectCreate,
     ProjectUpdate,
     ProjectResponse,
+    ProjectStats,
 )
+from app.api.conditional import Validators
 from app.api.deps.auth import get_current_user
 from app.api.deps.permissions import require_roles
+from app.api.responses import ORJSONResponse
+from app.core.cache import CachedResponse, response_cache
+from app.core.events import event_broker
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from app.db.deps import get_db
 from app.models.project import Project
 from app.models.user import User
+from app.services.changes import (
+    changed_comments_query,
+    changed_issues_query,
+    changes_page,
+    decode_changes_cursor,
+    deletions_query,
+    project_tombstone_query,
+    record_deletion,
+    settled_horizon,
+    tombstone,
+)
+from app.services.export import export_csv, export_ndjson
+from app.services.projects import (
+    PROJECT_LIST_CACHE_KEY,
+    list_projects_query,
+    project_cache_key,
+    project_entry,
+    project_list_entry,
+    project_response,
+)
+from app.services.stats import (
+    clear_project_stats,
+    project_stats,
+    project_stats_query,
+)
 
 router = APIRouter(
     prefix="/api/projects",
@@ -37,31 +82,26 @@ def create_project(
     db.add(project)
     db.commit()
     db.refresh(project)
+    response_cache.invalidate(PROJECT_LIST_CACHE_KEY)
 
-    return ProjectResponse(
-        id=str(project.id),
-        name=project.name,
-        description=project.description,
-    )
+    return project_response(project)
 
 
 @router.get(
     "",
     response_model=list[ProjectResponse],
+    response_class=ORJSONResponse,
 )
 def list_projects(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    projects = db.query(Project).all()
-    return [
-        ProjectResponse(
-            id=str(p.id),
-            name=p.name,
-            description=p.description,
-        )
-        for p in projects
-    ]
+    def load() -> CachedResponse:
+        rows = db.execute(list_projects_query()).all()
+        return project_list_entry(rows)
+
+    cached = response_cache.get_or_set(PROJECT_LIST_CACHE_KEY, load)
+    return cached.to_response()
 
 @router.get(
     "/{project_id}",
@@ -69,6 +109,32 @@ def list_projects(
 )
 def get_project(
     project_id: str,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        key = project_cache_key(project_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    def load() -> CachedResponse:
+        project = db.get(Project, project_id)
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+        return project_entry(project)
+
+    cached = response_cache.get_or_set(key, load)
+    validators = Validators.from_headers(cached.headers)
+    if validators.is_fresh(request):
+        return validators.not_modified()
+
+    return cached.to_response()
+
+@router.get("/{project_id}/export")
+def export_project(
+    project_id: str,
+    format: Literal["ndjson", "csv"] = "ndjson",
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -76,11 +142,115 @@ def get_project(
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    return ProjectResponse(
-        id=str(project.id),
-        name=project.name,
-        description=project.description,
+    if format == "csv":
+        body, media_type = export_csv(str(project.id)), "text/csv"
+    else:
+        body, media_type = export_ndjson(str(project.id)), "application/x-ndjson"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="project-{project.id}.{format}"'
+            )
+        },
+    )
+
+@router.get("/stats/batch", response_model=list[ProjectStats])
+def get_projects_stats(
+    ids: list[uuid.UUID] = Query(..., min_length=1, max_length=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    project_ids = list(
+        db.scalars(select(Project.id).where(Project.id.in_(set(ids))))
     )
+    if not project_ids:
+        return []
+
+    rows = db.execute(project_stats_query(project_ids)).all()
+    return project_stats(project_ids, rows)
+
+@router.get("/{project_id}/stats", response_model=ProjectStats)
+def get_project_stats(
+    project_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    project = db.get(Project, project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    rows = db.execute(project_stats_query([project.id])).all()
+    return project_stats([project.id], rows)[0]
+
+@router.get("/{project_id}/events")
+def project_events(
+    project_id: str,
+    last_event_id: str | None = Header(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    project = db.get(Project, project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    # The stream outlives the request; don't hold its pooled connection.
+    project_key = str(project.id)
+    db.close()
+
+    return StreamingResponse(
+        event_broker.stream(project_key, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.get(
+    "/{project_id}/changes",
+    response_model=ProjectChanges,
+    response_class=ORJSONResponse,
+)
+def get_project_changes(
+    project_id: uuid.UUID,
+    since: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    horizon = settled_horizon()
+    positions = decode_changes_cursor(since, horizon)
+
+    project = db.get(Project, project_id)
+    if not project:
+        deleted = db.execute(project_tombstone_query(project_id)).first()
+        if not deleted or since is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        return ORJSONResponse(
+            {
+                "issues": [],
+                "comments": [],
+                "deleted": [tombstone(deleted)],
+                "next_cursor": since,
+                "has_more": False,
+            }
+        )
+
+    rows = {
+        "issues": db.execute(
+            changed_issues_query(project_id, positions["issues"], horizon, limit)
+        ).all(),
+        "comments": db.execute(
+            changed_comments_query(
+                project_id, positions["comments"], horizon, limit
+            )
+        ).all(),
+        "deleted": db.execute(
+            deletions_query(project_id, positions["deleted"], horizon, limit)
+        ).all(),
+    }
+
+    return ORJSONResponse(changes_page(rows, positions, horizon, limit))
 
 @router.put(
     "/{project_id}",
@@ -103,13 +273,12 @@ def update_project(
 
     db.commit()
     db.refresh(project)
-
-    return ProjectResponse(
-        id=str(project.id),
-        name=project.name,
-        description=project.description,
+    response_cache.invalidate(
+        PROJECT_LIST_CACHE_KEY, project_cache_key(project.id)
     )
 
+    return project_response(project)
+
 @router.delete(
     "/{project_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -123,5 +292,10 @@ def delete_project(
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
+    clear_project_stats(db, project.id)
+    record_deletion(db, project.id, "project", project.id)
     db.delete(project)
     db.commit()
+    response_cache.invalidate(
+        PROJECT_LIST_CACHE_KEY, project_cache_key(project.id)
+    )
@@ -0,0 +1,54 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.api.deps.auth import get_current_user
+from app.api.schemas.search import SearchHit, SearchResults
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.db.deps import get_db
+from app.models.enums import IssueStatus
+from app.models.user import User
+from app.services.search import search as run_search
+
+router = APIRouter(
+    prefix="/api/search",
+    tags=["search"],
+)
+
+
+@router.get("", response_model=SearchResults)
+def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    project_id: str | None = None,
+    status_: list[IssueStatus] | None = Query(None, alias="status"),
+    include: Literal["all", "issues", "comments"] = "all",
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0, le=10_000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    rows = run_search(
+        db,
+        q,
+        project_id=project_id,
+        statuses=status_,
+        include=include,
+        limit=limit + 1,
+        offset=offset,
+    )
+
+    return SearchResults(
+        items=[
+            SearchHit(
+                type=row.type,
+                id=str(row.id),
+                issue_id=str(row.issue_id),
+                project_id=str(row.project_id),
+                title=row.title,
+                rank=row.rank,
+            )
+            for row in rows[:limit]
+        ],
+        next_offset=offset + limit if len(rows) > limit else None,
+    )
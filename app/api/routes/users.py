@@ -0,0 +1,37 @@
+import uuid
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.api.deps.auth import get_current_user
+from app.api.schemas.user import UserSummary
+from app.core import user_cache
+from app.core.pagination import MAX_PAGE_SIZE
+from app.db.deps import get_db
+from app.models.user import User
+
+router = APIRouter(
+    prefix="/api/users",
+    tags=["users"],
+)
+
+@router.get("", response_model=list[UserSummary])
+def get_users(
+    ids: list[uuid.UUID] = Query(..., min_length=1, max_length=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    user_ids = list(dict.fromkeys(str(user_id) for user_id in ids))
+    found, missing = user_cache.lookup(user_ids)
+
+    if missing:
+        rows = db.execute(
+            select(User.id, User.username).where(User.id.in_(missing))
+        ).all()
+        loaded = [user_cache.summary(row) for row in rows]
+        user_cache.remember(loaded)
+        found.update((entry["id"], entry) for entry in loaded)
+
+    # Unknown ids are left out rather than failing the whole batch.
+    return [found[user_id] for user_id in user_ids if user_id in found]
@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+from app.api.schemas.comment import CommentResponse
+from app.api.schemas.issue import IssueResponse
+
+
+class Tombstone(BaseModel):
+    entity: Literal["project", "issue", "comment"]
+    id: str
+    issue_id: Optional[str] = None
+    deleted_at: datetime
+
+
+class ProjectChanges(BaseModel):
+    issues: list[IssueResponse]
+    comments: list[CommentResponse]
+    deleted: list[Tombstone]
+    next_cursor: str
+    has_more: bool
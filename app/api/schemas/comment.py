@@ -1,6 +1,8 @@
 from pydantic import BaseModel
 from typing import Optional
 
+from app.api.schemas.user import UserSummary
+
 
 class CommentCreate(BaseModel):
     content: str
@@ -11,3 +13,12 @@ class CommentResponse(BaseModel):
     content: str
     issue_id: str
     user_id: str
+
+
+class CommentPage(BaseModel):
+    items: list[CommentResponse]
+    next_cursor: Optional[str] = None
+
+
+class CommentDetail(CommentResponse):
+    author: Optional[UserSummary]
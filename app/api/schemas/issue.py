@@ -1,5 +1,20 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Literal, Optional
+
+from app.api.schemas.comment import CommentDetail
+from app.api.schemas.project import ProjectSummary
+from app.api.schemas.user import UserSummary
+from app.core.config import settings
+
+
+IssueSort = Literal[
+    "created_at",
+    "-created_at",
+    "updated_at",
+    "-updated_at",
+    "priority",
+    "-priority",
+]
 
 
 class IssueCreate(BaseModel):
@@ -25,3 +40,60 @@ class IssueResponse(BaseModel):
     project_id: str
     created_by_id: str
     assignee_id: Optional[str]
+    comment_count: int
+
+
+IssueInclude = Literal["project", "reporter", "assignee", "comments"]
+
+
+class IssueDetailResponse(IssueResponse):
+    project: Optional[ProjectSummary] = None
+    reporter: Optional[UserSummary] = None
+    assignee: Optional[UserSummary] = None
+    comments: Optional[list[CommentDetail]] = None
+    comments_next_cursor: Optional[str] = None
+
+
+class IssuePage(BaseModel):
+    items: list[IssueResponse]
+    next_cursor: Optional[str] = None
+
+
+class IssueBulkUpdateItem(IssueUpdate):
+    id: str
+
+
+class IssueBulkAssignItem(BaseModel):
+    issue_id: str
+    user_id: str
+
+
+class IssueBulkCreate(BaseModel):
+    items: list[IssueCreate] = Field(
+        ..., min_length=1, max_length=settings.BULK_MAX_ITEMS
+    )
+
+
+class IssueBulkUpdate(BaseModel):
+    items: list[IssueBulkUpdateItem] = Field(
+        ..., min_length=1, max_length=settings.BULK_MAX_ITEMS
+    )
+
+
+class IssueBulkAssign(BaseModel):
+    items: list[IssueBulkAssignItem] = Field(
+        ..., min_length=1, max_length=settings.BULK_MAX_ITEMS
+    )
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    ok: bool
+    id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BulkResult(BaseModel):
+    succeeded: int
+    failed: int
+    results: list[BulkItemResult]
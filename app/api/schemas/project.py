@@ -15,3 +15,15 @@ class ProjectResponse(BaseModel):
     id: str
     name: str
     description: str | None
+
+
+class ProjectSummary(BaseModel):
+    id: str
+    name: str
+
+
+class ProjectStats(BaseModel):
+    project_id: str
+    total: int
+    by_status: dict[str, int]
+    by_priority: dict[str, int]
@@ -0,0 +1,17 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+
+class SearchHit(BaseModel):
+    type: Literal["issue", "comment"]
+    id: str
+    issue_id: str
+    project_id: str
+    title: str
+    rank: float
+
+
+class SearchResults(BaseModel):
+    items: list[SearchHit]
+    next_offset: Optional[int] = None
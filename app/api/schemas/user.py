@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+
+class UserSummary(BaseModel):
+    id: str
+    username: str
@@ -0,0 +1,263 @@
+"""Shared cache for serialized responses of hot read endpoints.
+
+Entries are opaque bytes so any backend that can store bytes with a TTL
+works. Writers invalidate the affected keys after they commit; the TTL
+bounds how long a fill that raced with an invalidation can stay stale.
+"""
+import asyncio
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+import orjson
+from fastapi import Response
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.lru import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+    media_type: str = "application/json"
+
+    def encode(self) -> bytes:
+        # orjson never emits a raw newline, so it can separate the parts.
+        meta = orjson.dumps(
+            {"headers": self.headers, "media_type": self.media_type}
+        )
+        return meta + b"\n" + self.body
+
+    @classmethod
+    def decode(cls, raw: bytes) -> "CachedResponse":
+        meta, body = raw.split(b"\n", 1)
+        return cls(body, **orjson.loads(meta))
+
+    def to_response(self) -> Response:
+        return Response(
+            self.body, media_type=self.media_type, headers=self.headers
+        )
+
+
+class MemoryBackend:
+    blocking = False
+
+    def __init__(self, maxsize: int):
+        self._cache = TTLCache(maxsize=maxsize)
+
+    def get(self, key: str) -> bytes | None:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self._cache.set(key, value, time.time() + ttl)
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._cache.pop(key)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+class RedisBackend:
+    """Any client speaking the redis-py API works, e.g. ``fakeredis``."""
+
+    blocking = True
+
+    def __init__(
+        self,
+        client: Any = None,
+        url: str | None = None,
+        prefix: str = "respcache:",
+    ):
+        if client is None:
+            try:
+                import redis
+            except ImportError as exc:
+                raise RuntimeError(
+                    "RESPONSE_CACHE_BACKEND=redis requires the 'redis' package"
+                ) from exc
+            client = redis.Redis.from_url(url or settings.RESPONSE_CACHE_REDIS_URL)
+        self._client = client
+        self._prefix = prefix
+
+    def get(self, key: str) -> bytes | None:
+        return self._client.get(self._prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self._client.set(self._prefix + key, value, ex=ttl)
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self._client.delete(*(self._prefix + key for key in keys))
+
+    def clear(self) -> None:
+        for key in self._client.scan_iter(match=self._prefix + "*"):
+            self._client.delete(key)
+
+
+class NullBackend:
+    blocking = False
+
+    def get(self, key: str) -> bytes | None:
+        return None
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        pass
+
+    def delete(self, *keys: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class ResponseCache:
+    def __init__(self, backend, ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # Single-flight: concurrent misses on one key wait for a single
+        # loader instead of all hitting the database.
+        self._locks: dict[str, tuple[threading.Lock, int]] = {}
+        self._async_locks: dict[str, tuple[asyncio.Lock, int]] = {}
+        self._guard = threading.Lock()
+
+    @contextmanager
+    def _flight(self, key: str):
+        with self._guard:
+            lock, waiters = self._locks.get(key, (None, 0))
+            lock = lock or threading.Lock()
+            self._locks[key] = (lock, waiters + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._guard:
+                lock, waiters = self._locks[key]
+                if waiters == 1:
+                    del self._locks[key]
+                else:
+                    self._locks[key] = (lock, waiters - 1)
+
+    @asynccontextmanager
+    async def _async_flight(self, key: str):
+        lock, waiters = self._async_locks.get(key, (None, 0))
+        lock = lock or asyncio.Lock()
+        self._async_locks[key] = (lock, waiters + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, waiters = self._async_locks[key]
+            if waiters == 1:
+                del self._async_locks[key]
+            else:
+                self._async_locks[key] = (lock, waiters - 1)
+
+    def _lookup(self, key: str) -> CachedResponse | None:
+        raw = self.backend.get(key)
+        return CachedResponse.decode(raw) if raw is not None else None
+
+    def _store(self, key: str, value: CachedResponse) -> None:
+        self.backend.set(key, value.encode(), self.ttl)
+
+    def get_or_set(
+        self, key: str, loader: Callable[[], CachedResponse]
+    ) -> CachedResponse:
+        cached = self._lookup(key)
+        if cached is None:
+            with self._flight(key):
+                cached = self._lookup(key)
+                if cached is None:
+                    self.misses += 1
+                    cached = loader()
+                    self._store(key, cached)
+                    return cached
+        self.hits += 1
+        return cached
+
+    async def get_or_set_async(
+        self, key: str, loader: Callable[[], Awaitable[CachedResponse]]
+    ) -> CachedResponse:
+        async def lookup() -> CachedResponse | None:
+            if self.backend.blocking:
+                return await run_in_threadpool(self._lookup, key)
+            return self._lookup(key)
+
+        cached = await lookup()
+        if cached is None:
+            async with self._async_flight(key):
+                cached = await lookup()
+                if cached is None:
+                    self.misses += 1
+                    cached = await loader()
+                    if self.backend.blocking:
+                        await run_in_threadpool(self._store, key, cached)
+                    else:
+                        self._store(key, cached)
+                    return cached
+        self.hits += 1
+        return cached
+
+    def invalidate(self, *keys: str) -> None:
+        self.backend.delete(*keys)
+
+    async def invalidate_async(self, *keys: str) -> None:
+        if self.backend.blocking:
+            await run_in_threadpool(self.backend.delete, *keys)
+        else:
+            self.backend.delete(*keys)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": type(self.backend).__name__,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def build_backend():
+    if settings.RESPONSE_CACHE_BACKEND == "redis":
+        return RedisBackend()
+    if settings.RESPONSE_CACHE_BACKEND == "off":
+        return NullBackend()
+    return MemoryBackend(maxsize=settings.RESPONSE_CACHE_MAX_SIZE)
+
+
+def warn_if_per_process() -> None:
+    """Log at startup when several workers would each keep their own cache.
+
+    A write only invalidates the memory backend of the worker that served
+    it, so the others keep returning the old body for up to the TTL.
+    """
+    if settings.RESPONSE_CACHE_BACKEND == "memory" and settings.WEB_CONCURRENCY > 1:
+        logger.warning(
+            "RESPONSE_CACHE_BACKEND=memory with WEB_CONCURRENCY=%d: "
+            "invalidations stay in the worker that made them and other "
+            "workers can serve stale responses for up to %ds; "
+            "use RESPONSE_CACHE_BACKEND=redis",
+            settings.WEB_CONCURRENCY,
+            settings.RESPONSE_CACHE_TTL_SECONDS,
+        )
+
+
+def cache_key(*parts: Any) -> str:
+    return ":".join(str(part) for part in parts)
+
+
+response_cache = ResponseCache(
+    build_backend(), ttl=settings.RESPONSE_CACHE_TTL_SECONDS
+)
@@ -1,8 +1,30 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    ASYNC_DATABASE_URL: str | None = None
+    DB_ASYNC_MODE: bool = False
+
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: float = 30.0
+    # "checkout" pings every checkout, "on_error" only after a disconnect
+    DB_POOL_PING: Literal["checkout", "on_error", "off"] = "checkout"
+    DB_POOL_PING_WINDOW_SECONDS: int = 30
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+    # statements at or above this duration are logged; 0 disables
+    DB_SLOW_QUERY_MS: int = 500
+    # bound parameters hold password hashes, emails and jtis; debug only
+    DB_SLOW_QUERY_LOG_PARAMS: bool = False
+
+    READINESS_DB_TIMEOUT_SECONDS: float = 2.0
+    # not ready once this fraction of pool_size + max_overflow is in use
+    READINESS_POOL_SATURATION: float = 0.9
+    READINESS_CHECK_MIGRATIONS: bool = True
 
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
@@ -11,6 +33,60 @@ class Settings(BaseSettings):
     JWT_PRIVATE_KEY_PATH: str = "keys/jwt_private.pem"
     JWT_PUBLIC_KEY_PATH: str = "keys/jwt_public.pem"
 
+    BULK_MAX_ITEMS: int = 1000
+
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536  # KiB
+    ARGON2_PARALLELISM: int = 4
+    # 0 hashes inline in the request thread
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_DEPTH: int = 16
+
+    TOKEN_CACHE_MAX_SIZE: int = 10_000
+    TOKEN_CACHE_TTL_SECONDS: int = 60
+
+    USER_CACHE_MAX_SIZE: int = 10_000
+    USER_CACHE_TTL_SECONDS: int = 300
+
+    # Worker processes behind the API; uvicorn and gunicorn take their
+    # default worker count from it. Only used to flag per-process backends
+    WEB_CONCURRENCY: int = 1
+
+    # "memory" is per process; use "redis" to share entries (and their
+    # invalidation) across workers
+    RESPONSE_CACHE_BACKEND: Literal["memory", "redis", "off"] = "memory"
+    RESPONSE_CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    RESPONSE_CACHE_MAX_SIZE: int = 1024
+    RESPONSE_CACHE_TTL_SECONDS: int = 30
+
+    # "postgres" fans events out to every worker through LISTEN/NOTIFY;
+    # "memory" only reaches subscribers connected to the same process
+    EVENTS_BACKEND: Literal["memory", "postgres"] = "memory"
+    EVENTS_CHANNEL: str = "project_events"
+    EVENTS_REPLAY_SIZE: int = 256
+    EVENTS_QUEUE_SIZE: int = 256
+    EVENTS_HEARTBEAT_SECONDS: int = 15
+    EVENTS_STREAM_MAX_SECONDS: int = 300
+
+    # Rows updated this recently are held back from the changes feed so
+    # that transactions still in flight can't commit behind a cursor
+    CHANGES_SETTLE_SECONDS: int = 5
+    CHANGES_RETENTION_DAYS: int = 30
+
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_POLL_SECONDS: float = 1.0
+    OUTBOX_MAX_ATTEMPTS: int = 8
+    OUTBOX_BACKOFF_SECONDS: float = 2.0
+    OUTBOX_BACKOFF_MAX_SECONDS: float = 600.0
+
+    REVOCATION_FILTER_CAPACITY: int = 100_000
+    REVOCATION_FILTER_ERROR_RATE: float = 0.001
+    REVOCATION_REFRESH_SECONDS: int = 5
+    REVOCATION_REFRESH_OVERLAP_SECONDS: int = 30
+    REVOCATION_REBUILD_SECONDS: int = 600
+    REVOCATION_PURGE_SECONDS: int = 3600
+    REVOCATION_PURGE_BATCH_SIZE: int = 5000
+
     class Config:
         env_file = ".env"
 
@@ -0,0 +1,321 @@
+"""Per-project change feed for issues and comments.
+
+Routes queue events on their session; they are published only once the
+transaction commits, so subscribers never see changes that rolled back.
+Each project keeps a short ring buffer so a reconnecting client can
+replay what it missed from its ``Last-Event-ID``.
+
+With ``EVENTS_BACKEND=postgres`` events travel through NOTIFY inside the
+committing transaction and every worker LISTENs, so all workers buffer
+the same events in the same (commit) order.
+"""
+import asyncio
+import logging
+import select as selectors
+import threading
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+import orjson
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more.
+NOTIFY_MAX_BYTES = 7999
+
+
+@dataclass(frozen=True)
+class Event:
+    id: str
+    project_id: str
+    type: str
+    data: dict[str, Any]
+
+    def encode(self) -> bytes:
+        return (
+            f"id: {self.id}\nevent: {self.type}\ndata: ".encode()
+            + orjson.dumps(self.data)
+            + b"\n\n"
+        )
+
+    def to_json(self) -> bytes:
+        return orjson.dumps(
+            {
+                "id": self.id,
+                "project_id": self.project_id,
+                "type": self.type,
+                "data": self.data,
+            }
+        )
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> "Event":
+        return cls(**orjson.loads(raw))
+
+    def compact(self) -> "Event":
+        # Only the ids survive; clients refetch the entity.
+        data = {
+            key: value
+            for key, value in self.data.items()
+            if key == "id" or key.endswith("_id")
+        }
+        data["partial"] = True
+        return Event(self.id, self.project_id, self.type, data)
+
+
+RESET = b"event: reset\ndata: {}\n\n"
+HEARTBEAT = b": keepalive\n\n"
+
+
+class Subscription:
+    __slots__ = ("project_id", "queue")
+
+    def __init__(self, project_id: str, size: int):
+        self.project_id = project_id
+        self.queue: asyncio.Queue[Event | None] = asyncio.Queue(size)
+
+
+class EventBroker:
+    """Fans committed events out to the SSE subscribers of this process.
+
+    Buffers and subscriber sets are only touched on the event loop, so
+    they need no locks; other threads hand events over with
+    ``call_soon_threadsafe``.
+    """
+
+    def __init__(self, replay_size: int, queue_size: int):
+        self.replay_size = replay_size
+        self.queue_size = queue_size
+        self.published = 0
+        self.dropped_subscribers = 0
+        self._buffers: dict[str, deque[Event]] = {}
+        self._subscribers: dict[str, set[Subscription]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._listener: PostgresListener | None = None
+
+    def start(self, engine: Engine | None = None) -> None:
+        self._loop = asyncio.get_running_loop()
+        if settings.EVENTS_BACKEND == "postgres" and engine is not None:
+            self._listener = PostgresListener(engine, self)
+            self._listener.start()
+
+    def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        for subscribers in self._subscribers.values():
+            for subscription in subscribers:
+                self._close(subscription)
+        self._loop = None
+
+    def publish(self, events: Iterable[Event]) -> None:
+        """Deliver ``events`` from any thread."""
+        loop = self._loop
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(self._dispatch, list(events))
+
+    def _dispatch(self, events: list[Event]) -> None:
+        for item in events:
+            buffer = self._buffers.get(item.project_id)
+            if buffer is None:
+                buffer = self._buffers[item.project_id] = deque(
+                    maxlen=self.replay_size
+                )
+            buffer.append(item)
+            self.published += 1
+
+            subscribers = self._subscribers.get(item.project_id, ())
+            for subscription in list(subscribers):
+                try:
+                    subscription.queue.put_nowait(item)
+                except asyncio.QueueFull:
+                    # A client this far behind reconnects and replays.
+                    self.dropped_subscribers += 1
+                    self.unsubscribe(subscription)
+                    self._close(subscription)
+
+    @staticmethod
+    def _close(subscription: Subscription) -> None:
+        queue = subscription.queue
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    def subscribe(
+        self, project_id: str, last_event_id: str | None = None
+    ) -> tuple[Subscription, list[Event] | None]:
+        """Register a subscriber and return the events it missed.
+
+        The replay is ``None`` when ``last_event_id`` has already left the
+        ring buffer; the client then has to refetch its lists.
+        """
+        subscription = Subscription(project_id, self.queue_size)
+        self._subscribers.setdefault(project_id, set()).add(subscription)
+
+        if not last_event_id:
+            return subscription, []
+
+        buffered = list(self._buffers.get(project_id, ()))
+        for position, item in enumerate(buffered):
+            if item.id == last_event_id:
+                return subscription, buffered[position + 1:]
+        return subscription, None
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._subscribers.get(subscription.project_id)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.project_id]
+
+    async def stream(self, project_id: str, last_event_id: str | None = None):
+        """Yield SSE frames for ``project_id`` until the client goes away."""
+        loop = asyncio.get_running_loop()
+        # Streams end after a while and clients reconnect with their
+        # Last-Event-ID; otherwise open streams would hold up a graceful
+        # shutdown indefinitely.
+        deadline = loop.time() + settings.EVENTS_STREAM_MAX_SECONDS
+        subscription, replay = self.subscribe(project_id, last_event_id)
+        try:
+            if replay is None:
+                yield RESET
+            else:
+                for item in replay:
+                    yield item.encode()
+
+            while (remaining := deadline - loop.time()) > 0:
+                try:
+                    item = await asyncio.wait_for(
+                        subscription.queue.get(),
+                        min(settings.EVENTS_HEARTBEAT_SECONDS, remaining),
+                    )
+                except asyncio.TimeoutError:
+                    yield HEARTBEAT
+                    continue
+                if item is None:
+                    return
+                yield item.encode()
+        finally:
+            self.unsubscribe(subscription)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": settings.EVENTS_BACKEND,
+            "subscribers": sum(len(s) for s in self._subscribers.values()),
+            "projects_buffered": len(self._buffers),
+            "published": self.published,
+            "dropped_subscribers": self.dropped_subscribers,
+        }
+
+
+class PostgresListener:
+    """LISTENs on ``EVENTS_CHANNEL`` and hands notifications to the broker."""
+
+    def __init__(self, engine: Engine, broker: EventBroker):
+        self._engine = engine
+        self._broker = broker
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._engine.dialect.driver != "psycopg2":
+            logger.error(
+                "EVENTS_BACKEND=postgres needs the psycopg2 driver, not %s; "
+                "events stay local to this worker",
+                self._engine.dialect.driver,
+            )
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="events-listener",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._listen()
+            except Exception:
+                logger.exception("Event listener failed; reconnecting")
+                self._stop.wait(1)
+
+    def _listen(self) -> None:
+        # A dedicated connection, detached so it doesn't hold a pool slot.
+        raw = self._engine.raw_connection()
+        raw.detach()
+        conn = raw.driver_connection
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(f'LISTEN "{settings.EVENTS_CHANNEL}"')
+
+            while not self._stop.is_set():
+                if not selectors.select([conn], [], [], 1.0)[0]:
+                    continue
+                conn.poll()
+                events = [Event.from_json(n.payload) for n in conn.notifies]
+                conn.notifies.clear()
+                if events:
+                    self._broker.publish(events)
+        finally:
+            conn.close()
+
+
+event_broker = EventBroker(
+    replay_size=settings.EVENTS_REPLAY_SIZE,
+    queue_size=settings.EVENTS_QUEUE_SIZE,
+)
+
+
+def queue_event(
+    db: Any, project_id: Any, type_: str, data: dict[str, Any]
+) -> None:
+    """Publish an event once ``db``'s transaction commits."""
+    db.info.setdefault("events", []).append(
+        Event(uuid.uuid4().hex, str(project_id), type_, data)
+    )
+
+
+@event.listens_for(Session, "before_commit")
+def _notify_queued_events(session: Session) -> None:
+    if settings.EVENTS_BACKEND != "postgres" or not session.info.get("events"):
+        return
+
+    # NOTIFY is transactional: it is delivered on commit, to every worker
+    # (this one included), so nothing is published locally.
+    for item in session.info.pop("events"):
+        payload = item.to_json()
+        if len(payload) > NOTIFY_MAX_BYTES:
+            payload = item.compact().to_json()
+        session.execute(
+            select(func.pg_notify(settings.EVENTS_CHANNEL, payload.decode()))
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_queued_events(session: Session) -> None:
+    events = session.info.pop("events", None)
+    if events:
+        event_broker.publish(events)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_queued_events(session: Session) -> None:
+    session.info.pop("events", None)
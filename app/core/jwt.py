@@ -5,6 +5,7 @@ import uuid
 from jose import jwt
 
 from app.core.config import settings
+from app.core.metrics import timed
 
 
 def _read_key(path: str) -> str:
@@ -42,7 +43,8 @@ def create_refresh_token(subject: str) -> str:
 
 
 def decode_token(token: str) -> dict[str, Any]:
-    return jwt.decode(token, PUBLIC_KEY, algorithms=[settings.JWT_ALGORITHM])
+    with timed("jwt_decode"):
+        return jwt.decode(token, PUBLIC_KEY, algorithms=[settings.JWT_ALGORITHM])
 
 def create_access_token(subject: str, role: str) -> str:
     expire = datetime.now(tz=timezone.utc) + timedelta(
@@ -0,0 +1,261 @@
+import hashlib
+import logging
+import math
+import threading
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.core.metrics import timed
+from app.db.session import SessionLocal
+from app.models.token_blacklist import TokenBlacklist
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(capacity, 1)
+        self.size = max(
+            8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.capacity = capacity
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7))
+            for pos in self._positions(key)
+        )
+
+
+class RevocationStore:
+    """In-process view of the unexpired rows in ``token_blacklist``.
+
+    A Bloom filter answers "definitely not revoked" without touching the
+    database; only possible hits are confirmed with a query. The filter is
+    refreshed incrementally from rows created since the last refresh and
+    rebuilt periodically so that expired jtis fall out of it.
+    """
+
+    def __init__(self, session_factory: sessionmaker):
+        self._session_factory = session_factory
+        self._filter: BloomFilter | None = None
+        self._watermark: datetime | None = None
+        # jtis already added from the overlap window, so re-reading it on
+        # every refresh doesn't count them into the filter again.
+        self._recent: dict[str, datetime] = {}
+        # Revoked by this process and added already, but not yet read back.
+        self._pending: set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._filter is not None
+
+    def reload(self, db: Session) -> int:
+        now = datetime.now(tz=timezone.utc)
+        rows = db.execute(
+            select(TokenBlacklist.jti, TokenBlacklist.created_at).where(
+                TokenBlacklist.expires_at > now
+            )
+        ).all()
+
+        bloom = BloomFilter(
+            max(settings.REVOCATION_FILTER_CAPACITY, 2 * len(rows)),
+            settings.REVOCATION_FILTER_ERROR_RATE,
+        )
+        for jti, _ in rows:
+            bloom.add(jti)
+
+        watermark = max((r.created_at for r in rows), default=None)
+        with self._lock:
+            self._filter = bloom
+            self._watermark = watermark
+            self._recent = {jti: created_at for jti, created_at in rows}
+            self._pending.clear()
+            self._trim_recent()
+
+        return len(rows)
+
+    def _trim_recent(self) -> None:
+        if self._watermark is None:
+            return
+        start = self._watermark - timedelta(
+            seconds=settings.REVOCATION_REFRESH_OVERLAP_SECONDS
+        )
+        self._recent = {
+            jti: created_at
+            for jti, created_at in self._recent.items()
+            if created_at > start
+        }
+
+    def refresh(self, db: Session) -> int:
+        if self._filter is None:
+            return self.reload(db)
+
+        query = select(TokenBlacklist.jti, TokenBlacklist.created_at)
+        if self._watermark is not None:
+            # Rows are stamped with their transaction's start time, so re-read
+            # a short overlap to pick up transactions that committed late.
+            query = query.where(
+                TokenBlacklist.created_at
+                > self._watermark
+                - timedelta(seconds=settings.REVOCATION_REFRESH_OVERLAP_SECONDS)
+            )
+        rows = db.execute(query).all()
+
+        added = 0
+        with self._lock:
+            for jti, created_at in rows:
+                if jti in self._recent:
+                    continue
+                self._recent[jti] = created_at
+                if jti in self._pending:
+                    self._pending.discard(jti)
+                else:
+                    self._filter.add(jti)
+                    added += 1
+                if self._watermark is None or created_at > self._watermark:
+                    self._watermark = created_at
+            self._trim_recent()
+            overfull = self._filter.count > self._filter.capacity
+
+        if overfull:
+            return self.reload(db)
+        return added
+
+    def add(self, jti: str) -> None:
+        with self._lock:
+            if self._filter is not None:
+                self._filter.add(jti)
+                self._pending.add(jti)
+
+    def revoke(
+        self,
+        db: Session | AsyncSession,
+        jti: str,
+        token_type: str,
+        expires_at: datetime,
+    ) -> None:
+        db.add(
+            TokenBlacklist(
+                jti=jti,
+                token_type=token_type,
+                expires_at=expires_at,
+            )
+        )
+        self.add(jti)
+
+    def might_be_revoked(self, jti: str) -> bool:
+        bloom = self._filter
+        return bloom is None or jti in bloom
+
+    def is_revoked(self, db: Session, jti: str) -> bool:
+        with timed("blacklist_lookup"):
+            if not self.might_be_revoked(jti):
+                return False
+            return db.scalar(self._lookup(jti)) is not None
+
+    async def is_revoked_async(self, db: AsyncSession, jti: str) -> bool:
+        with timed("blacklist_lookup"):
+            if not self.might_be_revoked(jti):
+                return False
+            return await db.scalar(self._lookup(jti)) is not None
+
+    @staticmethod
+    def _lookup(jti: str):
+        return select(TokenBlacklist.id).where(TokenBlacklist.jti == jti)
+
+    def purge_expired(self, db: Session, batch_size: int | None = None) -> int:
+        """Delete rows whose token has expired, ``batch_size`` at a time.
+
+        Each batch is its own short transaction, and rows another purge
+        has locked are skipped, so this can run next to live traffic.
+        """
+        batch_size = batch_size or settings.REVOCATION_PURGE_BATCH_SIZE
+        now = datetime.now(tz=timezone.utc)
+        batch = (
+            select(TokenBlacklist.id)
+            .where(TokenBlacklist.expires_at <= now)
+            .order_by(TokenBlacklist.expires_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+
+        purged = 0
+        while True:
+            result = db.execute(
+                delete(TokenBlacklist)
+                .where(TokenBlacklist.id.in_(batch))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            purged += result.rowcount
+            if result.rowcount < batch_size:
+                return purged
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+
+        try:
+            with self._session_factory() as db:
+                self.reload(db)
+        except Exception:
+            logger.exception("Initial revocation list load failed")
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="revocation-refresh",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        ticks = 0
+        refresh = settings.REVOCATION_REFRESH_SECONDS
+        rebuild_every = max(1, settings.REVOCATION_REBUILD_SECONDS // refresh)
+        purge_every = max(1, settings.REVOCATION_PURGE_SECONDS // refresh)
+
+        while not self._stop.wait(refresh):
+            ticks += 1
+            try:
+                with self._session_factory() as db:
+                    if ticks % purge_every == 0:
+                        self.purge_expired(db)
+                    if ticks % rebuild_every == 0:
+                        self.reload(db)
+                    else:
+                        self.refresh(db)
+            except Exception:
+                logger.exception("Revocation list refresh failed")
+
+
+revocation_store = RevocationStore(SessionLocal)
@@ -1,14 +1,127 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+
 from passlib.context import CryptContext
 
+from app.core.config import settings
+from app.core.metrics import timed
+
 pwd_context = CryptContext(
     schemes=["argon2"],
     deprecated="auto",
+    argon2__rounds=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
 )
 
 
+class PasswordHasherBusy(Exception):
+    pass
+
+
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
+
+
+def verify_and_update(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Verify a password and, if its hash uses outdated Argon2 parameters,
+    also return a replacement hash."""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(
+    max(1, settings.PASSWORD_HASH_WORKERS) + settings.PASSWORD_HASH_QUEUE_DEPTH
+)
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def _submit(fn, *args) -> Future:
+    # Fail fast instead of queueing without bound behind memory-hard work.
+    if not _slots.acquire(blocking=False):
+        raise PasswordHasherBusy()
+
+    try:
+        if settings.PASSWORD_HASH_WORKERS > 0:
+            future = _get_executor().submit(fn, *args)
+        else:
+            future = Future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+    except BaseException:
+        _slots.release()
+        raise
+
+    future.add_done_callback(lambda _: _slots.release())
+    return future
+
+
+def hash_password_pooled(password: str) -> str:
+    with timed("password_hash"):
+        return _submit(hash_password, password).result()
+
+
+def verify_password_pooled(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    with timed("password_hash"):
+        return _submit(
+            verify_and_update, plain_password, hashed_password
+        ).result()
+
+
+async def _run_async(fn, *args):
+    if settings.PASSWORD_HASH_WORKERS > 0:
+        return await asyncio.wrap_future(_submit(fn, *args))
+
+    # Without a process pool the hash still must not run on the event
+    # loop; the inline path in _submit is for sync (threadpool) callers.
+    if not _slots.acquire(blocking=False):
+        raise PasswordHasherBusy()
+    try:
+        return await asyncio.to_thread(fn, *args)
+    finally:
+        _slots.release()
+
+
+async def hash_password_async(password: str) -> str:
+    with timed("password_hash"):
+        return await _run_async(hash_password, password)
+
+
+async def verify_password_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    with timed("password_hash"):
+        return await _run_async(
+            verify_and_update, plain_password, hashed_password
+        )
+
+
+def shutdown_password_pool() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
@@ -0,0 +1,82 @@
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+
+from app.core.config import settings
+from app.core.lru import TTLCache
+from app.models.user import User
+
+token_cache = TTLCache(maxsize=settings.TOKEN_CACHE_MAX_SIZE)
+
+
+@dataclass(frozen=True)
+class CachedToken:
+    claims: dict[str, Any]
+    user: dict[str, Any]
+
+    def to_user(self) -> User:
+        # Rebuild a clean, detached User so it can be merged into the
+        # request session with load=False (no SELECT).
+        user = User(**self.user)
+        make_transient_to_detached(user)
+        return user
+
+
+def _key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def lookup(token: str) -> CachedToken | None:
+    return token_cache.get(_key(token))
+
+
+def remember(token: str, claims: dict[str, Any], user: User) -> None:
+    expires_at = min(
+        float(claims["exp"]),
+        time.time() + settings.TOKEN_CACHE_TTL_SECONDS,
+    )
+    snapshot = {
+        attr.key: getattr(user, attr.key)
+        for attr in inspect(User).column_attrs
+    }
+    token_cache.set(_key(token), CachedToken(claims, snapshot), expires_at)
+
+
+def invalidate_token(token: str) -> None:
+    token_cache.pop(_key(token))
+
+
+def invalidate_user(user_id: Any) -> int:
+    user_id = str(user_id)
+    return token_cache.discard_where(
+        lambda entry: str(entry.user["id"]) == user_id
+    )
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _queue_user_invalidation(mapper, connection, target: User) -> None:
+    # Role changes and deactivation must not be masked by a cached
+    # snapshot. Clearing at flush time would let a concurrent request
+    # re-cache the still-committed row before this transaction lands, so
+    # the ids wait for the commit.
+    session = object_session(target)
+    if session is None:
+        invalidate_user(target.id)
+        return
+    session.info.setdefault("stale_users", set()).add(str(target.id))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    for user_id in session.info.pop("stale_users", ()):
+        invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_stale_users(session: Session) -> None:
+    session.info.pop("stale_users", None)
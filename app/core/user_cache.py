@@ -0,0 +1,38 @@
+import time
+from typing import Iterable
+
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.core.lru import TTLCache
+from app.models.user import User
+
+user_cache = TTLCache(maxsize=settings.USER_CACHE_MAX_SIZE)
+
+
+def summary(user: User) -> dict[str, str]:
+    return {"id": str(user.id), "username": user.username}
+
+
+def lookup(user_ids: Iterable[str]) -> tuple[dict[str, dict], list[str]]:
+    """Split ``user_ids`` into cached summaries and ids still to load."""
+    found, missing = {}, []
+    for user_id in user_ids:
+        entry = user_cache.get(user_id)
+        if entry is None:
+            missing.append(user_id)
+        else:
+            found[user_id] = entry
+    return found, missing
+
+
+def remember(summaries: Iterable[dict[str, str]]) -> None:
+    expires_at = time.time() + settings.USER_CACHE_TTL_SECONDS
+    for entry in summaries:
+        user_cache.set(entry["id"], entry, expires_at)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_changed_user(mapper, connection, target: User) -> None:
+    user_cache.pop(str(target.id))
@@ -0,0 +1,117 @@
+"""Readiness checks: pool saturation, a pooled ping and the schema revision."""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import settings
+from app.db.pool import pool_stats
+from app.db.session import async_engine, engine
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+# A hung database must not pile probe threads up without bound.
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="readiness")
+_schema_current = False
+
+
+@lru_cache(maxsize=1)
+def head_revisions() -> frozenset[str]:
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option(
+        "script_location", str(ALEMBIC_INI.parent / "alembic")
+    )
+    return frozenset(ScriptDirectory.from_config(config).get_heads())
+
+
+def pool_saturation(engine: Engine) -> dict[str, Any]:
+    stats = pool_stats(engine)
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"ok": True, **stats}
+
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    saturation = pool.checkedout() / capacity if capacity else 0.0
+    return {
+        "ok": saturation < settings.READINESS_POOL_SATURATION,
+        "saturation": round(saturation, 3),
+        "threshold": settings.READINESS_POOL_SATURATION,
+        **stats,
+    }
+
+
+def _ping(engine: Engine) -> dict[str, Any]:
+    global _schema_current
+
+    start = time.perf_counter()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        result: dict[str, Any] = {
+            "ok": True,
+            "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+        }
+
+        if settings.READINESS_CHECK_MIGRATIONS and not _schema_current:
+            context = MigrationContext.configure(conn)
+            current = frozenset(context.get_current_heads())
+            head = head_revisions()
+            # Once the schema is at head it stays there for this process.
+            _schema_current = current == head
+            result["migrations"] = {
+                "ok": _schema_current,
+                "current": sorted(current),
+                "head": sorted(head),
+            }
+
+    return result
+
+
+async def _ping_async() -> dict[str, Any]:
+    start = time.perf_counter()
+    async with async_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    return {
+        "ok": True,
+        "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+    }
+
+
+async def _probe(awaitable) -> dict[str, Any]:
+    try:
+        return await asyncio.wait_for(
+            awaitable, settings.READINESS_DB_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        return {"ok": False, "error": "timeout"}
+    except Exception as exc:
+        return {"ok": False, "error": type(exc).__name__}
+
+
+async def readiness() -> dict[str, Any]:
+    checks: dict[str, Any] = {"pool": pool_saturation(engine)}
+    # A saturated pool is reported without pinging: the ping would only
+    # queue behind the requests already waiting for a connection.
+    if checks["pool"]["ok"]:
+        checks["database"] = await _probe(
+            asyncio.wrap_future(_executor.submit(_ping, engine))
+        )
+        migrations = checks["database"].pop("migrations", None)
+        if migrations is not None:
+            checks["migrations"] = migrations
+
+    if async_engine is not None:
+        checks["async_pool"] = pool_saturation(async_engine.sync_engine)
+        if checks["async_pool"]["ok"]:
+            checks["async_database"] = await _probe(_ping_async())
+
+    ready = all(check["ok"] for check in checks.values())
+    return {"ready": ready, "checks": checks}
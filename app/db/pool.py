@@ -0,0 +1,145 @@
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+
+
+class _WaitStatsMixin:
+    """Records how long callers wait for a connection to be handed out."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # Connections are checked out from many threads at once.
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            with self._stats_lock:
+                self.checkouts += 1
+                self.timeouts += timed_out
+                self.wait_total += waited
+                if waited > self.wait_max:
+                    self.wait_max = waited
+
+    def wait_stats(self) -> dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_total_seconds": round(self.wait_total, 6),
+                "wait_max_seconds": round(self.wait_max, 6),
+                "wait_avg_seconds": round(
+                    self.wait_total / self.checkouts if self.checkouts else 0.0,
+                    6,
+                ),
+            }
+
+
+class InstrumentedQueuePool(_WaitStatsMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_WaitStatsMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(url: str, is_async: bool = False) -> dict[str, Any]:
+    backend = make_url(url).get_backend_name()
+    options: dict[str, Any] = {
+        "pool_pre_ping": settings.DB_POOL_PING == "checkout",
+    }
+
+    if backend == "sqlite" and make_url(url).database in (None, "", ":memory:"):
+        return options
+
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+    )
+
+    if backend == "postgresql" and settings.DB_STATEMENT_TIMEOUT_MS:
+        timeout = str(settings.DB_STATEMENT_TIMEOUT_MS)
+        if is_async:
+            options["connect_args"] = {
+                "server_settings": {"statement_timeout": timeout}
+            }
+        else:
+            options["connect_args"] = {
+                "options": f"-c statement_timeout={timeout}"
+            }
+
+    return options
+
+
+def install_ping_on_error(engine: Engine) -> None:
+    """Ping connections on checkout only for a while after a disconnect.
+
+    Replaces ``pool_pre_ping``'s round-trip on every checkout: the pool is
+    trusted until a statement fails with a disconnect error (e.g. after a
+    database failover), then every checkout is verified for
+    ``DB_POOL_PING_WINDOW_SECONDS``.
+    """
+    lock = threading.Lock()
+    suspect_until = 0.0
+
+    @event.listens_for(engine, "handle_error")
+    def _mark_suspect(context) -> None:
+        nonlocal suspect_until
+        if context.is_disconnect:
+            with lock:
+                suspect_until = (
+                    time.monotonic() + settings.DB_POOL_PING_WINDOW_SECONDS
+                )
+
+    @event.listens_for(engine, "checkout")
+    def _ping(dbapi_connection, connection_record, connection_proxy) -> None:
+        if time.monotonic() >= suspect_until:
+            return
+
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+        except Exception:
+            # The pool discards this connection and retries with a new one.
+            raise exc.DisconnectionError()
+        finally:
+            cursor.close()
+
+
+def pool_stats(engine: Engine) -> dict[str, Any]:
+    pool = engine.pool
+    stats: dict[str, Any] = {"pool_class": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+        )
+
+    if isinstance(pool, _WaitStatsMixin):
+        stats.update(pool.wait_stats())
+
+    return stats
@@ -0,0 +1,132 @@
+"""Per-request SQL statement counting and timing.
+
+``install_query_hooks`` attaches cursor-execute listeners to an engine.
+Every statement is charged to the ``QueryStats`` in the current context
+(set per request by ``RequestMetricsMiddleware``) and to any active
+``assert_query_budget`` block; ``tests/test_query_budgets.py`` holds the
+key endpoints to a budget.
+"""
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+MAX_LOGGED_PARAMS = 500
+
+
+@dataclass(slots=True)
+class QueryStats:
+    count: int = 0
+    duration: float = 0.0
+    statements: list[str] | None = None
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.duration += elapsed
+        if self.statements is not None:
+            self.statements.append(statement)
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+_budgets: list[QueryStats] = []
+
+
+def current_query_stats() -> QueryStats | None:
+    return _current.get()
+
+
+class track_queries:
+    """Charges statements made in this context to a fresh QueryStats.
+
+    Sync endpoints run in a worker thread with a copy of the context, so
+    they share the same (mutable) object.
+    """
+
+    __slots__ = ("stats", "_token")
+
+    def __enter__(self) -> QueryStats:
+        self.stats = QueryStats()
+        self._token = _current.set(self.stats)
+        return self.stats
+
+    def __exit__(self, *exc_info) -> None:
+        _current.reset(self._token)
+
+
+def _before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+    for budget in _budgets:
+        budget.record(statement, elapsed)
+
+    if settings.DB_SLOW_QUERY_MS and elapsed * 1000 >= settings.DB_SLOW_QUERY_MS:
+        if settings.DB_SLOW_QUERY_LOG_PARAMS:
+            logger.warning(
+                "Slow query (%.1f ms): %s | params=%.*s",
+                elapsed * 1000,
+                statement,
+                MAX_LOGGED_PARAMS,
+                repr(parameters),
+            )
+        else:
+            logger.warning("Slow query (%.1f ms): %s", elapsed * 1000, statement)
+
+
+def _handle_error(exception_context) -> None:
+    # A failed statement never reaches after_cursor_execute.
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start"):
+        conn.info["query_start"].pop()
+
+
+def install_query_hooks(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+@contextmanager
+def assert_query_budget(max_queries: int) -> Iterator[QueryStats]:
+    """Fail if the block issues more than ``max_queries`` statements.
+
+    Counts statements from every thread, so it also sees queries made by
+    the app while a test client request is in flight::
+
+        with assert_query_budget(3):
+            client.get("/api/projects", headers=auth)
+    """
+    stats = QueryStats(statements=[])
+    _budgets.append(stats)
+    try:
+        yield stats
+    finally:
+        _budgets.remove(stats)
+
+    if stats.count > max_queries:
+        listing = "\n".join(
+            f"  {i}. {statement}"
+            for i, statement in enumerate(stats.statements, 1)
+        )
+        raise AssertionError(
+            f"Expected at most {max_queries} queries, got {stats.count}:\n{listing}"
+        )
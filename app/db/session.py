@@ -1,19 +1,68 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 from app.core.config import settings
+from app.db.pool import engine_options, install_ping_on_error
+from app.db.query_stats import install_query_hooks
 
 
 class Base(DeclarativeBase):
     pass
 
 
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def async_database_url() -> str:
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+
+    url = make_url(settings.DATABASE_URL)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise RuntimeError(
+            f"No async driver known for {url.drivername!r}; "
+            "set ASYNC_DATABASE_URL explicitly"
+        )
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
+    **engine_options(settings.DATABASE_URL),
 )
 
+if settings.DB_POOL_PING == "on_error":
+    install_ping_on_error(engine)
+
+install_query_hooks(engine)
+
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
     bind=engine,
 )
+
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.DB_ASYNC_MODE:
+    async_engine = create_async_engine(
+        async_database_url(),
+        **engine_options(async_database_url(), is_async=True),
+    )
+
+    if settings.DB_POOL_PING == "on_error":
+        install_ping_on_error(async_engine.sync_engine)
+
+    install_query_hooks(async_engine.sync_engine)
+
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
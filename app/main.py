@@ -1,16 +1,101 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.responses import JSONResponse
+from app.api.middleware import RequestMetricsMiddleware
 from app.api.routes.auth import router as auth_router
 from app.api.routes.projects import router as project_router
 from app.api.routes.issues import router as issue_router
 from app.api.routes.comments import router as comment_router
+from app.api.routes.metrics import router as metrics_router
+from app.api.routes.search import router as search_router
+from app.api.routes.users import router as user_router
+from app.core.cache import warn_if_per_process
+from app.core.config import settings
+from app.core.events import event_broker
+from app.core.revocation import revocation_store
+from app.core.security import PasswordHasherBusy, shutdown_password_pool
+from app.db.health import readiness
+from app.db.session import async_engine, engine
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warn_if_per_process()
+    revocation_store.start()
+    event_broker.start(engine)
+    yield
+    event_broker.stop()
+    revocation_store.stop()
+    shutdown_password_pool()
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+app = FastAPI(title="Bug Tracker API", lifespan=lifespan)
+app.add_middleware(RequestMetricsMiddleware)
+
 
-app = FastAPI(title="Bug Tracker API")
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server busy, please retry"},
+        headers={"Retry-After": "1"},
+    )
 
-app.include_router(auth_router)
-app.include_router(project_router)
-app.include_router(issue_router)
-app.include_router(comment_router)
+
+def _without(router: APIRouter, replacement: APIRouter) -> APIRouter:
+    """``router`` minus the endpoints that ``replacement`` also serves."""
+    replaced = {
+        (route.path, method)
+        for route in replacement.routes
+        for method in route.methods
+    }
+    remaining = APIRouter()
+    remaining.routes.extend(
+        route
+        for route in router.routes
+        if not any((route.path, method) in replaced for method in route.methods)
+    )
+    return remaining
+
+
+if settings.DB_ASYNC_MODE:
+    from app.api.async_routes.auth import router as async_auth_router
+    from app.api.async_routes.projects import router as async_project_router
+    from app.api.async_routes.issues import router as async_issue_router
+    from app.api.async_routes.comments import router as async_comment_router
+
+    # Each async router replaces the sync endpoints it re-implements, so
+    # every operation is published once; endpoints without an async
+    # variant stay on the sync router.
+    for async_router, sync_router in (
+        (async_auth_router, auth_router),
+        (async_project_router, project_router),
+        (async_issue_router, issue_router),
+        (async_comment_router, comment_router),
+    ):
+        app.include_router(async_router)
+        app.include_router(_without(sync_router, async_router))
+else:
+    app.include_router(auth_router)
+    app.include_router(project_router)
+    app.include_router(issue_router)
+    app.include_router(comment_router)
+
+app.include_router(search_router)
+app.include_router(user_router)
+app.include_router(metrics_router)
 
 @app.get("/health", tags=["health"])
 def health_check():
     return {"status": "ok"}
+
+@app.get("/health/ready", tags=["health"])
+async def readiness_check():
+    report = await readiness()
+    return JSONResponse(
+        status_code=200 if report["ready"] else 503,
+        content=report,
+    )
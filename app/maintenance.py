@@ -0,0 +1,74 @@
+"""Maintenance commands, meant to be run from cron or by hand.
+
+    python -m app.maintenance rebuild-stats
+    python -m app.maintenance purge-deletion-log
+    python -m app.maintenance purge-token-blacklist [--batch-size N]
+"""
+import argparse
+import time
+
+from app.core.config import settings
+from app.core.revocation import revocation_store
+from app.db.session import SessionLocal
+from app.services.changes import purge_deletion_log
+from app.services.stats import rebuild_issue_stats
+
+
+def rebuild_stats(args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        rows = rebuild_issue_stats(db)
+    elapsed = time.perf_counter() - started
+    print(f"Rebuilt {rows} project issue counters in {elapsed:.2f}s")
+
+
+def purge_deletions(args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        rows = purge_deletion_log(db)
+    elapsed = time.perf_counter() - started
+    print(f"Purged {rows} deletion log entries in {elapsed:.2f}s")
+
+
+def purge_token_blacklist(args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        rows = revocation_store.purge_expired(db, args.batch_size)
+    elapsed = time.perf_counter() - started
+    print(f"Purged {rows} expired token blacklist rows in {elapsed:.2f}s")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.maintenance")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = commands.add_parser(
+        "rebuild-stats",
+        help="Recompute project issue counters from the issues table",
+    )
+    rebuild.set_defaults(handler=rebuild_stats)
+
+    purge = commands.add_parser(
+        "purge-deletion-log",
+        help="Drop tombstones older than CHANGES_RETENTION_DAYS",
+    )
+    purge.set_defaults(handler=purge_deletions)
+
+    purge_tokens = commands.add_parser(
+        "purge-token-blacklist",
+        help="Delete blacklist rows whose token has expired",
+    )
+    purge_tokens.add_argument(
+        "--batch-size",
+        type=int,
+        default=settings.REVOCATION_PURGE_BATCH_SIZE,
+        help="rows deleted per transaction",
+    )
+    purge_tokens.set_defaults(handler=purge_token_blacklist)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,3 +3,7 @@ from app.models.project import Project
 from app.models.issue import Issue
 from app.models.comment import Comment
 from app.models.token_blacklist import TokenBlacklist
+from app.models.project_stats import ProjectIssueStats
+from app.models.deletion_log import DeletionLog
+from app.models.outbox import OutboxMessage
+import app.models.search
@@ -2,27 +2,68 @@ import uuid
 from datetime import datetime
 
 from sqlalchemy import DateTime, func
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
 
 from app.db.session import Base
 
+class UUIDType(TypeDecorator):
+    """UUID that also binds its string form.
+
+    Path parameters reach queries as ``str``. The PostgreSQL drivers accept
+    that, but SQLite (used as a local and benchmark stand-in) needs a
+    ``uuid.UUID``. Foreign keys inherit this type from the referenced id.
+    """
+
+    impl = UUID
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if isinstance(value, str):
+            return uuid.UUID(value)
+        return value
+
+class TimestampType(TypeDecorator):
+    """``DateTime`` that SQLite stores the way ``CURRENT_TIMESTAMP`` does.
+
+    SQLite compares timestamps as text. Server defaults are stored without
+    fractional seconds, while SQLAlchemy binds ``.ffffff``; a keyset
+    predicate would then order rows within the same second wrongly.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(
+                sqlite.DATETIME(
+                    storage_format=(
+                        "%(year)04d-%(month)02d-%(day)02d "
+                        "%(hour)02d:%(minute)02d:%(second)02d"
+                    )
+                )
+            )
+        return super().load_dialect_impl(dialect)
+
 class UUIDPrimaryKeyMixin:
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
+        UUIDType(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
     )
 
 class TimestampMixin:
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        TimestampType(timezone=True),
         server_default=func.now(),
         nullable=False,
     )
 
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        TimestampType(timezone=True),
         server_default=func.now(),
         onupdate=func.now(),
         nullable=False,
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, Text
+from sqlalchemy import ForeignKey, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
@@ -6,6 +6,15 @@ from app.models.base import BaseModel
 
 class Comment(BaseModel):
     __tablename__ = "comments"
+    __table_args__ = (
+        Index("ix_comments_issue_id_created_at_id", "issue_id", "created_at", "id"),
+        Index(
+            "ix_comments_project_id_updated_at_id",
+            "project_id",
+            "updated_at",
+            "id",
+        ),
+    )
 
     content: Mapped[str] = mapped_column(
         Text,
@@ -17,6 +26,13 @@ class Comment(BaseModel):
         nullable=False,
     )
 
+    # Copied from the issue (issues never move between projects) so the
+    # project change feed can walk its own comment index.
+    project_id: Mapped[str] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
     author_id: Mapped[str] = mapped_column(
         ForeignKey("users.id", ondelete="RESTRICT"),
         nullable=False,
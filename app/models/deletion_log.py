@@ -0,0 +1,44 @@
+import uuid
+
+from sqlalchemy import Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import BaseModel, UUIDType
+
+
+class DeletionLog(BaseModel):
+    """Tombstones for deleted rows, read by the project changes feed.
+
+    No foreign keys: the rows (and possibly the project) are gone.
+    ``created_at`` is the deletion time.
+    """
+
+    __tablename__ = "deletion_log"
+    __table_args__ = (
+        Index(
+            "ix_deletion_log_project_id_created_at_id",
+            "project_id",
+            "created_at",
+            "id",
+        ),
+    )
+
+    project_id: Mapped[uuid.UUID] = mapped_column(
+        UUIDType(as_uuid=True),
+        nullable=False,
+    )
+
+    entity: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,  # project | issue | comment
+    )
+
+    entity_id: Mapped[uuid.UUID] = mapped_column(
+        UUIDType(as_uuid=True),
+        nullable=False,
+    )
+
+    issue_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUIDType(as_uuid=True),
+        nullable=True,
+    )
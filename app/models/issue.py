@@ -1,14 +1,29 @@
 from datetime import date
 
-from sqlalchemy import Date, ForeignKey, String, Text
+from sqlalchemy import Date, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
 from app.models.enums import IssuePriority, IssueStatus
 
+OPEN_STATUSES_SQL = "status IN ('open', 'in_progress', 'reopened')"
+
 
 class Issue(BaseModel):
     __tablename__ = "issues"
+    __table_args__ = (
+        Index("ix_issues_project_id_created_at_id", "project_id", "created_at", "id"),
+        Index("ix_issues_project_id_updated_at_id", "project_id", "updated_at", "id"),
+        Index("ix_issues_project_id_status_priority", "project_id", "status", "priority"),
+        Index("ix_issues_assignee_id_status", "assignee_id", "status"),
+        Index(
+            "ix_issues_open_assignee_id_priority",
+            "assignee_id",
+            "priority",
+            postgresql_where=text(OPEN_STATUSES_SQL),
+            sqlite_where=text(OPEN_STATUSES_SQL),
+        ),
+    )
 
     title: Mapped[str] = mapped_column(
         String(200),
@@ -50,6 +65,14 @@ class Issue(BaseModel):
         nullable=True,
     )
 
+    # Kept in step with the comments table by the comment routes.
+    comment_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+
     project = relationship("Project")
     reporter = relationship("User", foreign_keys=[reporter_id])
     assignee = relationship("User", foreign_keys=[assignee_id])
@@ -0,0 +1,63 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import BaseModel
+
+PENDING_SQL = "status = 'pending'"
+
+
+class OutboxMessage(BaseModel):
+    """Side-effect work written in the same transaction as the change.
+
+    Drained by ``python -m app.worker``; delivered messages are deleted,
+    so only pending and failed ones stay in the table.
+    """
+
+    __tablename__ = "outbox"
+    __table_args__ = (
+        Index(
+            "ix_outbox_pending_available_at",
+            "available_at",
+            postgresql_where=text(PENDING_SQL),
+            sqlite_where=text(PENDING_SQL),
+        ),
+    )
+
+    topic: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+    )
+
+    payload: Mapped[dict[str, Any]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"),
+        nullable=False,
+    )
+
+    status: Mapped[str] = mapped_column(
+        String(10),
+        default="pending",
+        server_default="pending",
+        nullable=False,  # pending | failed
+    )
+
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    last_error: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
@@ -0,0 +1,31 @@
+import uuid
+
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+from app.models.enums import IssuePriority, IssueStatus
+
+
+class ProjectIssueStats(Base):
+    __tablename__ = "project_issue_stats"
+
+    project_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    status: Mapped[IssueStatus] = mapped_column(
+        primary_key=True,
+    )
+
+    priority: Mapped[IssuePriority] = mapped_column(
+        primary_key=True,
+    )
+
+    count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
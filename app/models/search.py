@@ -0,0 +1,53 @@
+"""Full-text search plumbing that lives outside the mapped columns.
+
+On PostgreSQL, ``issues.search_vector`` and ``comments.search_vector`` are
+generated ``tsvector`` columns with GIN indexes, created by migration
+``c9d41e7a2f63``. They are not mapped because the ORM never writes them.
+
+SQLite (used for tests and local stand-ins) has no tsvector, so
+``create_all`` builds FTS5 external-content tables kept in sync by
+triggers instead.
+"""
+from sqlalchemy import DDL, event
+
+from app.models.comment import Comment
+from app.models.issue import Issue
+
+
+def _fts5_ddl(table: str, columns: list[str]) -> list[str]:
+    fts = f"{table}_fts"
+    cols = ", ".join(columns)
+    new = ", ".join(f"new.{c}" for c in columns)
+    old = ", ".join(f"old.{c}" for c in columns)
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5("
+        f"{cols}, content='{table}', content_rowid='rowid')",
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.rowid, {new}); END",
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) "
+        f"VALUES ('delete', old.rowid, {old}); END",
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) "
+        f"VALUES ('delete', old.rowid, {old}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.rowid, {new}); END",
+    ]
+
+
+for _table, _columns in (
+    (Issue.__table__, ["title", "description"]),
+    (Comment.__table__, ["content"]),
+):
+    for _statement in _fts5_ddl(_table.name, _columns):
+        event.listen(
+            _table,
+            "after_create",
+            DDL(_statement).execute_if(dialect="sqlite"),
+        )
+    event.listen(
+        _table,
+        "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {_table.name}_fts").execute_if(
+            dialect="sqlite"
+        ),
+    )
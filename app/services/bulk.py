@@ -0,0 +1,247 @@
+import uuid
+from typing import Any, Iterable
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+from app.api.schemas.issue import (
+    BulkItemResult,
+    BulkResult,
+    IssueBulkAssignItem,
+    IssueBulkUpdateItem,
+    IssueCreate,
+)
+from app.models.enums import IssuePriority, IssueStatus
+from app.models.issue import Issue
+from app.models.project import Project
+from app.models.user import User
+from app.services.issues import queue_issue_event
+from app.services.outbox import enqueue
+from app.services.stats import adjust_issue_stats, stats_key
+
+PRIORITIES = {p.value for p in IssuePriority}
+STATUSES = {s.value for s in IssueStatus}
+
+
+def _parse_uuid(value: str) -> uuid.UUID | None:
+    try:
+        return uuid.UUID(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _existing(
+    db: Session, column: InstrumentedAttribute, ids: Iterable[uuid.UUID | None]
+) -> set[uuid.UUID]:
+    ids = {i for i in ids if i is not None}
+    if not ids:
+        return set()
+    return set(db.scalars(select(column).where(column.in_(ids))))
+
+
+def _failed(index: int, error: str) -> BulkItemResult:
+    return BulkItemResult(index=index, ok=False, error=error)
+
+
+def _summary(results: list[BulkItemResult]) -> BulkResult:
+    results.sort(key=lambda r: r.index)
+    succeeded = sum(1 for r in results if r.ok)
+    return BulkResult(
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results=results,
+    )
+
+
+def _queue_events(db: Session, type_: str, ids: list[uuid.UUID]) -> None:
+    # One event per applied item, like the single-item routes; the issues
+    # are read back in one query once the bulk statement has run.
+    if not ids:
+        return
+    issues = {
+        issue.id: issue
+        for issue in db.scalars(select(Issue).where(Issue.id.in_(ids)))
+    }
+    for issue_id in ids:
+        queue_issue_event(db, type_, issues[issue_id])
+
+
+def _validate_fields(fields: dict[str, Any]) -> str | None:
+    for name in ("title", "priority", "status"):
+        if name in fields and fields[name] is None:
+            return f"{name} cannot be null"
+    if "priority" in fields and fields["priority"] not in PRIORITIES:
+        return "Invalid priority"
+    if "status" in fields and fields["status"] not in STATUSES:
+        return "Invalid status"
+    return None
+
+
+def bulk_create_issues(
+    db: Session, items: list[IssueCreate], reporter_id: uuid.UUID
+) -> BulkResult:
+    project_ids = [_parse_uuid(item.project_id) for item in items]
+    known_projects = _existing(db, Project.id, project_ids)
+
+    results: list[BulkItemResult] = []
+    rows: list[dict[str, Any]] = []
+    row_indexes: list[int] = []
+
+    for index, (item, project_id) in enumerate(zip(items, project_ids)):
+        if project_id not in known_projects:
+            results.append(_failed(index, "Project not found"))
+            continue
+
+        error = _validate_fields({"priority": item.priority})
+        if error:
+            results.append(_failed(index, error))
+            continue
+
+        rows.append(
+            {
+                "title": item.title,
+                "description": item.description or "",
+                "priority": item.priority,
+                "project_id": project_id,
+                "reporter_id": reporter_id,
+            }
+        )
+        row_indexes.append(index)
+
+    if rows:
+        # A single multi-row INSERT ... RETURNING (batched by the driver).
+        ids = db.scalars(
+            insert(Issue).returning(Issue.id, sort_by_parameter_order=True),
+            rows,
+        ).all()
+        adjust_issue_stats(
+            db,
+            added=[
+                stats_key(row["project_id"], IssueStatus.open, row["priority"])
+                for row in rows
+            ],
+        )
+        results.extend(
+            BulkItemResult(index=index, ok=True, id=str(issue_id))
+            for index, issue_id in zip(row_indexes, ids)
+        )
+        _queue_events(db, "issue.created", ids)
+        for issue_id, row in zip(ids, rows):
+            enqueue(
+                db,
+                "issue.created",
+                {"issue_id": str(issue_id), "project_id": str(row["project_id"])},
+            )
+
+    db.commit()
+    return _summary(results)
+
+
+def bulk_update_issues(
+    db: Session, items: list[IssueBulkUpdateItem], current_user: User
+) -> BulkResult:
+    issue_ids = [_parse_uuid(item.id) for item in items]
+    valid_ids = {i for i in issue_ids if i is not None}
+    current = (
+        {
+            row.id: row
+            for row in db.execute(
+                select(
+                    Issue.id,
+                    Issue.assignee_id,
+                    Issue.project_id,
+                    Issue.status,
+                    Issue.priority,
+                ).where(Issue.id.in_(valid_ids))
+            )
+        }
+        if valid_ids
+        else {}
+    )
+    privileged = current_user.role in ("admin", "manager")
+
+    results: list[BulkItemResult] = []
+    rows: list[dict[str, Any]] = []
+    before = {
+        issue_id: stats_key(row.project_id, row.status, row.priority)
+        for issue_id, row in current.items()
+    }
+    after = dict(before)
+
+    for index, (item, issue_id) in enumerate(zip(items, issue_ids)):
+        if issue_id not in current:
+            results.append(_failed(index, "Issue not found"))
+            continue
+
+        if not privileged and current[issue_id].assignee_id != current_user.id:
+            results.append(_failed(index, "Not allowed"))
+            continue
+
+        fields = item.model_dump(exclude_unset=True, exclude={"id"})
+        error = _validate_fields(fields)
+        if error:
+            results.append(_failed(index, error))
+            continue
+
+        if "description" in fields and fields["description"] is None:
+            fields["description"] = ""
+
+        if fields:
+            rows.append({"id": issue_id, **fields})
+
+        project_id, status, priority = after[issue_id]
+        after[issue_id] = stats_key(
+            project_id,
+            fields.get("status", status),
+            fields.get("priority", priority),
+        )
+        results.append(BulkItemResult(index=index, ok=True, id=str(issue_id)))
+
+    if rows:
+        # ORM bulk UPDATE by primary key: one executemany per distinct
+        # set of updated columns.
+        db.execute(update(Issue), rows)
+        adjust_issue_stats(db, removed=before.values(), added=after.values())
+        _queue_events(db, "issue.updated", [row["id"] for row in rows])
+
+    db.commit()
+    return _summary(results)
+
+
+def bulk_assign_issues(
+    db: Session, items: list[IssueBulkAssignItem]
+) -> BulkResult:
+    issue_ids = [_parse_uuid(item.issue_id) for item in items]
+    user_ids = [_parse_uuid(item.user_id) for item in items]
+    known_issues = _existing(db, Issue.id, issue_ids)
+    known_users = _existing(db, User.id, user_ids)
+
+    results: list[BulkItemResult] = []
+    rows: list[dict[str, Any]] = []
+
+    for index, (issue_id, user_id) in enumerate(zip(issue_ids, user_ids)):
+        if issue_id not in known_issues:
+            results.append(_failed(index, "Issue not found"))
+            continue
+        if user_id not in known_users:
+            results.append(_failed(index, "User not found"))
+            continue
+
+        rows.append({"id": issue_id, "assignee_id": user_id})
+        results.append(BulkItemResult(index=index, ok=True, id=str(issue_id)))
+
+    if rows:
+        db.execute(update(Issue), rows)
+        _queue_events(db, "issue.assigned", [row["id"] for row in rows])
+        for row in rows:
+            enqueue(
+                db,
+                "issue.assigned",
+                {
+                    "issue_id": str(row["id"]),
+                    "assignee_id": str(row["assignee_id"]),
+                },
+            )
+
+    db.commit()
+    return _summary(results)
@@ -0,0 +1,237 @@
+"""Incremental sync for a project: rows changed since a cursor.
+
+Issues, comments and tombstones are three keyset streams over
+``(updated_at, id)`` (``created_at`` for tombstones). The cursor holds a
+position in each, so a page costs work proportional to what changed.
+
+``updated_at`` is stamped when a transaction starts, so a row can commit
+with a timestamp older than one a client has already read. Only rows
+older than ``CHANGES_SETTLE_SECONDS`` are served; once a stream has
+caught up its position moves to that horizon.
+"""
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import Row, Select, delete, select, tuple_
+
+from app.core.config import settings
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.comment import Comment
+from app.models.deletion_log import DeletionLog
+from app.models.issue import Issue
+from app.services.comments import COMMENT_COLUMNS, COMMENT_FIELDS
+from app.services.issues import ISSUE_COLUMNS, ISSUE_FIELDS
+
+STREAMS = ("issues", "comments", "deleted")
+
+# Sorts after every id, so a (horizon, MAX_ID) position excludes all rows
+# stamped at or before the horizon.
+MAX_ID = uuid.UUID(int=(1 << 128) - 1)
+
+Position = tuple[datetime, uuid.UUID]
+
+
+def record_deletion(
+    db: Any,
+    project_id: Any,
+    entity: str,
+    entity_id: Any,
+    issue_id: Any = None,
+) -> None:
+    db.add(
+        DeletionLog(
+            project_id=project_id,
+            entity=entity,
+            entity_id=entity_id,
+            issue_id=issue_id,
+        )
+    )
+
+
+def settled_horizon() -> datetime:
+    return datetime.now(tz=timezone.utc) - timedelta(
+        seconds=settings.CHANGES_SETTLE_SECONDS
+    )
+
+
+def decode_changes_cursor(
+    cursor: str | None, horizon: datetime
+) -> dict[str, Position | None]:
+    if cursor is None:
+        # A full sync has nothing to delete locally, so skip old tombstones.
+        return {"issues": None, "comments": None, "deleted": (horizon, MAX_ID)}
+
+    values = decode_cursor(cursor)
+    try:
+        positions = {
+            stream: _decode_position(values[stream]) for stream in STREAMS
+        }
+    except (KeyError, IndexError, TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+    # Tombstones past the retention window may already be purged. Issue
+    # and comment positions can be arbitrarily old, e.g. mid full sync.
+    deleted = positions["deleted"]
+    retention = timedelta(days=settings.CHANGES_RETENTION_DAYS)
+    if deleted is not None and deleted[0] < horizon - retention:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Cursor expired, resync the project",
+        )
+
+    return positions
+
+
+def _decode_position(value: list[str] | None) -> Position | None:
+    if value is None:
+        return None
+    stamp, row_id = value
+    return _aware(datetime.fromisoformat(stamp)), uuid.UUID(row_id)
+
+
+def _aware(value: datetime) -> datetime:
+    # SQLite hands back naive UTC timestamps.
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _stream(
+    query: Select,
+    stamp: Any,
+    row_id: Any,
+    after: Position | None,
+    horizon: datetime,
+    limit: int,
+) -> Select:
+    query = query.where(stamp <= horizon)
+    if after is not None:
+        query = query.where(
+            tuple_(stamp, row_id)
+            > tuple_(*after, types=(stamp.type, row_id.type))
+        )
+    # One extra row tells us whether the stream has more.
+    return query.order_by(stamp, row_id).limit(limit + 1)
+
+
+def changed_issues_query(
+    project_id: Any, after: Position | None, horizon: datetime, limit: int
+) -> Select:
+    return _stream(
+        select(*ISSUE_COLUMNS, Issue.updated_at.label("sort_key")).where(
+            Issue.project_id == project_id
+        ),
+        Issue.updated_at,
+        Issue.id,
+        after,
+        horizon,
+        limit,
+    )
+
+
+def changed_comments_query(
+    project_id: Any, after: Position | None, horizon: datetime, limit: int
+) -> Select:
+    return _stream(
+        select(*COMMENT_COLUMNS, Comment.updated_at.label("sort_key")).where(
+            Comment.project_id == project_id
+        ),
+        Comment.updated_at,
+        Comment.id,
+        after,
+        horizon,
+        limit,
+    )
+
+
+def deletions_query(
+    project_id: Any, after: Position | None, horizon: datetime, limit: int
+) -> Select:
+    return _stream(
+        select(
+            DeletionLog.entity,
+            DeletionLog.entity_id,
+            DeletionLog.issue_id,
+            DeletionLog.created_at.label("sort_key"),
+            DeletionLog.id,
+        ).where(DeletionLog.project_id == project_id),
+        DeletionLog.created_at,
+        DeletionLog.id,
+        after,
+        horizon,
+        limit,
+    )
+
+
+def project_tombstone_query(project_id: Any) -> Select:
+    return select(
+        DeletionLog.entity,
+        DeletionLog.entity_id,
+        DeletionLog.issue_id,
+        DeletionLog.created_at.label("sort_key"),
+    ).where(
+        DeletionLog.entity == "project",
+        DeletionLog.entity_id == project_id,
+    )
+
+
+def tombstone(row: Row) -> dict[str, Any]:
+    return {
+        "entity": row.entity,
+        "id": str(row.entity_id),
+        "issue_id": str(row.issue_id) if row.issue_id else None,
+        "deleted_at": row.sort_key,
+    }
+
+
+def _encode_position(position: Position | None) -> list[str] | None:
+    if position is None:
+        return None
+    return [position[0].isoformat(), str(position[1])]
+
+
+def changes_page(
+    rows: dict[str, Sequence[Row]],
+    positions: dict[str, Position | None],
+    horizon: datetime,
+    limit: int,
+) -> dict[str, Any]:
+    has_more = False
+    page: dict[str, list[Row]] = {}
+    for stream in STREAMS:
+        stream_rows = list(rows[stream])
+        if len(stream_rows) > limit:
+            has_more = True
+            stream_rows = stream_rows[:limit]
+            last = stream_rows[-1]
+            positions[stream] = (last.sort_key, last.id)
+        else:
+            positions[stream] = (horizon, MAX_ID)
+        page[stream] = stream_rows
+
+    return {
+        # zip() stops before the trailing sort_key column.
+        "issues": [dict(zip(ISSUE_FIELDS, row)) for row in page["issues"]],
+        "comments": [
+            dict(zip(COMMENT_FIELDS, row)) for row in page["comments"]
+        ],
+        "deleted": [tombstone(row) for row in page["deleted"]],
+        "next_cursor": encode_cursor(
+            {s: _encode_position(p) for s, p in positions.items()}
+        ),
+        "has_more": has_more,
+    }
+
+
+def purge_deletion_log(db: Any) -> int:
+    cutoff = datetime.now(tz=timezone.utc) - timedelta(
+        days=settings.CHANGES_RETENTION_DAYS
+    )
+    result = db.execute(
+        delete(DeletionLog).where(DeletionLog.created_at < cutoff)
+    )
+    db.commit()
+    return result.rowcount
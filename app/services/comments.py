@@ -0,0 +1,108 @@
+import uuid
+from datetime import datetime
+from typing import Any, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import Row, Select, Update, func, select, tuple_, update
+
+from app.api.schemas.comment import CommentResponse
+from app.core.events import queue_event
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.comment import Comment
+from app.models.issue import Issue
+
+COMMENT_COLUMNS = (
+    Comment.id,
+    Comment.content,
+    Comment.issue_id,
+    Comment.author_id.label("user_id"),
+)
+COMMENT_FIELDS = tuple(CommentResponse.model_fields)
+
+
+def comment_response(comment: Comment) -> CommentResponse:
+    return CommentResponse(
+        id=str(comment.id),
+        content=comment.content,
+        issue_id=str(comment.issue_id),
+        user_id=str(comment.author_id),
+    )
+
+
+def comment_cursor(created_at: datetime, comment_id: Any) -> str:
+    return encode_cursor({"key": created_at.isoformat(), "id": str(comment_id)})
+
+
+def _decode_comment_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    values = decode_cursor(cursor)
+    try:
+        return datetime.fromisoformat(values["key"]), uuid.UUID(values["id"])
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def list_comments_query(
+    issue_id: str, limit: int, cursor: str | None = None
+) -> Select:
+    query = select(*COMMENT_COLUMNS, Comment.created_at.label("sort_key")).where(
+        Comment.issue_id == issue_id
+    )
+
+    if cursor:
+        created_at, last_id = _decode_comment_cursor(cursor)
+        query = query.where(
+            tuple_(Comment.created_at, Comment.id)
+            > tuple_(
+                created_at,
+                last_id,
+                types=(Comment.created_at.type, Comment.id.type),
+            )
+        )
+
+    # One extra row tells us whether there is a next page.
+    return query.order_by(Comment.created_at, Comment.id).limit(limit + 1)
+
+
+def comment_list_version_query(issue_id: str) -> Select:
+    return select(
+        func.count().label("count"),
+        func.max(Comment.updated_at).label("last_modified"),
+    ).where(Comment.issue_id == issue_id)
+
+
+def comment_page(rows: Sequence[Row], limit: int) -> dict[str, Any]:
+    rows = list(rows)
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = comment_cursor(rows[-1].sort_key, rows[-1].id)
+
+    return {
+        # zip() stops before the trailing sort_key column.
+        "items": [dict(zip(COMMENT_FIELDS, row)) for row in rows],
+        "next_cursor": next_cursor,
+    }
+
+
+def adjust_comment_count(issue_id: Any, delta: int) -> Update:
+    # Incremented in SQL so concurrent comments on one issue don't race.
+    # Returns the issue's project_id for the change feed.
+    return (
+        update(Issue)
+        .where(Issue.id == issue_id)
+        .values(comment_count=Issue.comment_count + delta)
+        .returning(Issue.project_id)
+    )
+
+
+def queue_comment_event(
+    db: Any, type_: str, project_id: Any, comment: Comment
+) -> None:
+    if type_ == "comment.deleted":
+        data = {"id": str(comment.id), "issue_id": str(comment.issue_id)}
+    else:
+        data = comment_response(comment).model_dump()
+    queue_event(db, project_id, type_, data)
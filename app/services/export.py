@@ -0,0 +1,131 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Iterator
+
+from sqlalchemy import select
+from sqlalchemy.orm import aliased
+
+from app.db.session import SessionLocal
+from app.models.comment import Comment
+from app.models.issue import Issue
+from app.models.user import User
+
+EXPORT_BATCH_SIZE = 1000
+
+CSV_COLUMNS = [
+    "record_type",
+    "id",
+    "issue_id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "due_date",
+    "reporter",
+    "assignee",
+    "author",
+    "content",
+    "created_at",
+    "updated_at",
+]
+
+
+def _issue_rows(db, project_id: str) -> Iterator[dict[str, Any]]:
+    reporter = aliased(User)
+    assignee = aliased(User)
+    stmt = (
+        select(
+            Issue.id,
+            Issue.title,
+            Issue.description,
+            Issue.status,
+            Issue.priority,
+            Issue.due_date,
+            reporter.username.label("reporter"),
+            assignee.username.label("assignee"),
+            Issue.created_at,
+            Issue.updated_at,
+        )
+        .join(reporter, Issue.reporter_id == reporter.id)
+        .outerjoin(assignee, Issue.assignee_id == assignee.id)
+        .where(Issue.project_id == project_id)
+        .order_by(Issue.created_at, Issue.id)
+        .execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE)
+    )
+    for row in db.execute(stmt):
+        yield {"record_type": "issue", **row._asdict()}
+
+
+def _comment_rows(db, project_id: str) -> Iterator[dict[str, Any]]:
+    author = aliased(User)
+    stmt = (
+        select(
+            Comment.id,
+            Comment.issue_id,
+            author.username.label("author"),
+            Comment.content,
+            Comment.created_at,
+            Comment.updated_at,
+        )
+        .join(Issue, Comment.issue_id == Issue.id)
+        .join(author, Comment.author_id == author.id)
+        .where(Issue.project_id == project_id)
+        .order_by(Comment.created_at, Comment.id)
+        .execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE)
+    )
+    for row in db.execute(stmt):
+        yield {"record_type": "comment", **row._asdict()}
+
+
+def _records(project_id: str) -> Iterator[dict[str, Any]]:
+    # The export outlives the request's dependencies, so it owns a session
+    # (and one pooled connection) for as long as the response streams.
+    with SessionLocal() as db:
+        yield from _issue_rows(db, project_id)
+        yield from _comment_rows(db, project_id)
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _chunks(records: Iterator[dict[str, Any]], render) -> Iterator[str]:
+    buffer = io.StringIO()
+    for count, record in enumerate(records, start=1):
+        render(buffer, record)
+        if count % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def export_ndjson(project_id: str) -> Iterator[str]:
+    def render(buffer, record):
+        buffer.write(json.dumps({k: _plain(v) for k, v in record.items()}))
+        buffer.write("\n")
+
+    return _chunks(_records(project_id), render)
+
+
+def export_csv(project_id: str) -> Iterator[str]:
+    header = io.StringIO()
+    csv.writer(header).writerow(CSV_COLUMNS)
+
+    def render(buffer, record):
+        csv.writer(buffer).writerow(
+            [_plain(record.get(column)) for column in CSV_COLUMNS]
+        )
+
+    yield header.getvalue()
+    yield from _chunks(_records(project_id), render)
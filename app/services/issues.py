@@ -0,0 +1,278 @@
+import uuid
+from datetime import datetime
+from enum import Enum
+from typing import Any, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import Row, Select, case, func, literal, select, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import joinedload, raiseload
+from sqlalchemy.sql.expression import FunctionElement
+
+from app.api.deps.issues import IssueListParams
+from app.api.schemas.issue import IssueDetailResponse, IssueResponse
+from app.core.events import queue_event
+from app.core.pagination import DEFAULT_PAGE_SIZE, decode_cursor, encode_cursor
+from app.services.comments import comment_cursor
+from app.models.comment import Comment
+from app.models.enums import IssuePriority
+from app.models.issue import Issue
+from app.models.project import Project
+from app.models.user import User
+
+SORT_COLUMNS = {
+    "created_at": Issue.created_at,
+    "updated_at": Issue.updated_at,
+    "priority": Issue.priority,
+}
+
+
+class priority_rank(FunctionElement):
+    """Orders priorities by their declaration rank.
+
+    PostgreSQL's native enum already sorts that way, so the column is
+    used as is (and its indexes stay usable); SQLite stores the names as
+    text and gets a CASE over the rank instead.
+    """
+
+    name = "priority_rank"
+    inherit_cache = True
+
+
+@compiles(priority_rank)
+def _compile_priority_rank(element, compiler, **kw):
+    return compiler.process(element.clauses, **kw)
+
+
+@compiles(priority_rank, "sqlite")
+def _compile_priority_rank_sqlite(element, compiler, **kw):
+    (value,) = element.clauses
+    rank = case(
+        {priority: n for n, priority in enumerate(IssuePriority)},
+        value=value,
+    )
+    return compiler.process(rank, **kw)
+
+
+def _ordered(field: str, value: Any) -> Any:
+    return priority_rank(value) if field == "priority" else value
+
+# Selected in IssueResponse field order so rows zip straight into dicts.
+ISSUE_COLUMNS = (
+    Issue.id,
+    Issue.title,
+    Issue.description,
+    Issue.status,
+    Issue.priority,
+    Issue.project_id,
+    Issue.reporter_id.label("created_by_id"),
+    Issue.assignee_id,
+    Issue.comment_count,
+)
+ISSUE_FIELDS = tuple(IssueResponse.model_fields)
+
+
+def issue_response(issue: Issue) -> IssueResponse:
+    return IssueResponse(
+        id=str(issue.id),
+        title=issue.title,
+        description=issue.description,
+        status=issue.status,
+        priority=issue.priority,
+        project_id=str(issue.project_id),
+        created_by_id=str(issue.reporter_id),
+        assignee_id=str(issue.assignee_id) if issue.assignee_id else None,
+        comment_count=issue.comment_count,
+    )
+
+
+ISSUE_RELATIONS = {
+    "project": (Issue.project, (Project.id, Project.name)),
+    "reporter": (Issue.reporter, (User.id, User.username)),
+    "assignee": (Issue.assignee, (User.id, User.username)),
+}
+
+
+def queue_issue_event(db: Any, type_: str, issue: Issue) -> None:
+    queue_event(
+        db, issue.project_id, type_, issue_response(issue).model_dump(mode="json")
+    )
+
+
+def _user_summary(user: User | None) -> dict[str, str] | None:
+    if user is None:
+        return None
+    return {"id": str(user.id), "username": user.username}
+
+
+def issue_detail_query(issue_id: uuid.UUID, include: set[str]) -> Select:
+    # Requested relations are joined into the issue query; anything else
+    # raises instead of lazy loading, so the query count stays fixed.
+    options = [
+        joinedload(relation).load_only(*columns)
+        for name, (relation, columns) in ISSUE_RELATIONS.items()
+        if name in include
+    ]
+    return (
+        select(Issue)
+        .where(Issue.id == issue_id)
+        .options(*options, raiseload("*"))
+    )
+
+
+def issue_comments_query(
+    issue_id: uuid.UUID, limit: int = DEFAULT_PAGE_SIZE
+) -> Select:
+    return (
+        select(Comment)
+        .where(Comment.issue_id == issue_id)
+        .order_by(Comment.created_at, Comment.id)
+        .options(
+            joinedload(Comment.author).load_only(User.id, User.username),
+            raiseload("*"),
+        )
+        .limit(limit + 1)
+    )
+
+
+def issue_detail(
+    issue: Issue,
+    include: set[str],
+    comments: Sequence[Comment] | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> IssueDetailResponse:
+    detail = issue_response(issue).model_dump()
+
+    if "project" in include:
+        detail["project"] = {
+            "id": str(issue.project.id),
+            "name": issue.project.name,
+        }
+    if "reporter" in include:
+        detail["reporter"] = _user_summary(issue.reporter)
+    if "assignee" in include:
+        detail["assignee"] = _user_summary(issue.assignee)
+    if comments is not None:
+        if len(comments) > limit:
+            comments = comments[:limit]
+            detail["comments_next_cursor"] = comment_cursor(
+                comments[-1].created_at, comments[-1].id
+            )
+        detail["comments"] = [
+            {
+                "id": str(comment.id),
+                "content": comment.content,
+                "issue_id": str(comment.issue_id),
+                "user_id": str(comment.author_id),
+                "author": _user_summary(comment.author),
+            }
+            for comment in comments
+        ]
+
+    return IssueDetailResponse(**detail)
+
+
+def _cursor_key(value: Any) -> str:
+    if isinstance(value, Enum):
+        return value.value
+    return value.isoformat()
+
+
+def _decode_issue_cursor(cursor: str, sort: str) -> tuple[Any, uuid.UUID]:
+    values = decode_cursor(cursor)
+    field = sort.lstrip("-")
+    try:
+        if values["sort"] != sort:
+            raise ValueError("cursor was issued for a different sort order")
+        if field == "priority":
+            key = IssuePriority(values["key"])
+        else:
+            key = datetime.fromisoformat(values["key"])
+        return key, uuid.UUID(values["id"])
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def _filtered(query: Select, params: IssueListParams) -> Select:
+    query = query.where(Issue.project_id == params.project_id)
+
+    if params.status:
+        query = query.where(Issue.status.in_(params.status))
+    if params.priority:
+        query = query.where(Issue.priority.in_(params.priority))
+    if params.assignee_id:
+        query = query.where(Issue.assignee_id == params.assignee_id)
+    if params.reporter_id:
+        query = query.where(Issue.reporter_id == params.reporter_id)
+    if params.due_after:
+        query = query.where(Issue.due_date >= params.due_after)
+    if params.due_before:
+        query = query.where(Issue.due_date <= params.due_before)
+
+    return query
+
+
+def list_issues_query(params: IssueListParams) -> Select:
+    field = params.sort.lstrip("-")
+    descending = params.sort.startswith("-")
+    sort_column = SORT_COLUMNS[field]
+
+    query = _filtered(
+        select(*ISSUE_COLUMNS, sort_column.label("sort_key")), params
+    )
+
+    if params.cursor:
+        key, last_id = _decode_issue_cursor(params.cursor, params.sort)
+        position = tuple_(_ordered(field, sort_column), Issue.id)
+        # Bound with the columns' types, so SQLite gets the stored format.
+        last = tuple_(
+            _ordered(field, literal(key, sort_column.type)),
+            literal(last_id, Issue.id.type),
+        )
+        if descending:
+            query = query.where(position < last)
+        else:
+            query = query.where(position > last)
+
+    order_key = _ordered(field, sort_column)
+    if descending:
+        query = query.order_by(order_key.desc(), Issue.id.desc())
+    else:
+        query = query.order_by(order_key, Issue.id)
+
+    # One extra row tells us whether there is a next page.
+    return query.limit(params.limit + 1)
+
+
+def issue_list_version_query(params: IssueListParams) -> Select:
+    return _filtered(
+        select(
+            func.count().label("count"),
+            func.max(Issue.updated_at).label("last_modified"),
+        ).select_from(Issue),
+        params,
+    )
+
+
+def issue_page(rows: Sequence[Row], params: IssueListParams) -> dict[str, Any]:
+    rows = list(rows)
+    next_cursor = None
+    if len(rows) > params.limit:
+        rows = rows[: params.limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            {
+                "sort": params.sort,
+                "key": _cursor_key(last.sort_key),
+                "id": str(last.id),
+            }
+        )
+
+    return {
+        # zip() stops before the trailing sort_key column.
+        "items": [dict(zip(ISSUE_FIELDS, row)) for row in rows],
+        "next_cursor": next_cursor,
+    }
@@ -0,0 +1,58 @@
+"""Outbox handlers for issue notifications.
+
+Delivery is a log line for now; swap in mail or chat delivery here
+without touching the routes.
+"""
+import logging
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.issue import Issue
+from app.models.user import User
+from app.services.outbox import register
+
+logger = logging.getLogger(__name__)
+
+
+def _recipients(db: Session, *user_ids: Any) -> list[str]:
+    ids = {user_id for user_id in user_ids if user_id}
+    if not ids:
+        return []
+    return list(db.scalars(select(User.email).where(User.id.in_(ids))))
+
+
+def _notify(recipients: list[str], subject: str) -> None:
+    for recipient in recipients:
+        logger.info("Notify %s: %s", recipient, subject)
+
+
+@register("issue.created")
+def issue_created(db: Session, payload: dict[str, Any]) -> None:
+    issue = db.get(Issue, payload["issue_id"])
+    if issue is None:
+        return
+    _notify(
+        _recipients(db, issue.project.created_by_id),
+        f"New issue {issue.title!r}",
+    )
+
+
+@register("issue.assigned")
+def issue_assigned(db: Session, payload: dict[str, Any]) -> None:
+    _notify(
+        _recipients(db, payload["assignee_id"]),
+        f"Issue {payload['issue_id']} was assigned to you",
+    )
+
+
+@register("issue.closed")
+def issue_closed(db: Session, payload: dict[str, Any]) -> None:
+    issue = db.get(Issue, payload["issue_id"])
+    if issue is None:
+        return
+    _notify(
+        _recipients(db, issue.reporter_id, issue.assignee_id),
+        f"Issue {issue.title!r} was closed",
+    )
@@ -0,0 +1,101 @@
+"""Transactional outbox: queue side effects with the change that causes them.
+
+Routes call :func:`enqueue` before committing, so a message exists if and
+only if its change does. ``python -m app.worker`` drains the table with
+:func:`process_batch` and hands each message to the handler registered
+for its topic.
+"""
+import logging
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.outbox import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[Session, dict[str, Any]], None]
+
+handlers: dict[str, Handler] = {}
+
+
+def register(topic: str) -> Callable[[Handler], Handler]:
+    def decorator(fn: Handler) -> Handler:
+        handlers[topic] = fn
+        return fn
+
+    return decorator
+
+
+def enqueue(db: Any, topic: str, payload: dict[str, Any]) -> None:
+    db.add(OutboxMessage(topic=topic, payload=payload))
+
+
+def backoff(attempts: int) -> timedelta:
+    delay = min(
+        settings.OUTBOX_BACKOFF_SECONDS * 2 ** (attempts - 1),
+        settings.OUTBOX_BACKOFF_MAX_SECONDS,
+    )
+    # Jitter keeps retries of a failed burst from landing together.
+    return timedelta(seconds=delay * random.uniform(0.5, 1.0))
+
+
+def process_batch(db: Session, limit: int) -> tuple[int, int]:
+    """Deliver up to ``limit`` due messages; return (delivered, failed).
+
+    Claimed rows stay locked until the batch commits, and SKIP LOCKED
+    lets several workers drain the table side by side. Each message runs
+    in a savepoint so one failing handler doesn't undo the others.
+    """
+    now = datetime.now(tz=timezone.utc)
+    messages = db.scalars(
+        select(OutboxMessage)
+        .where(
+            OutboxMessage.status == "pending",
+            OutboxMessage.available_at <= now,
+        )
+        .order_by(OutboxMessage.available_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    ).all()
+
+    delivered = failed = 0
+    for message in messages:
+        handler = handlers.get(message.topic)
+        try:
+            if handler is None:
+                raise LookupError(f"No handler for topic {message.topic!r}")
+            with db.begin_nested():
+                handler(db, message.payload)
+        except Exception as exc:
+            failed += 1
+            message.attempts += 1
+            message.last_error = repr(exc)[:1000]
+            exhausted = message.attempts >= settings.OUTBOX_MAX_ATTEMPTS
+            if handler is None or exhausted:
+                message.status = "failed"
+                logger.error(
+                    "Outbox message %s (%s) failed for good: %r",
+                    message.id,
+                    message.topic,
+                    exc,
+                )
+            else:
+                message.available_at = now + backoff(message.attempts)
+                logger.warning(
+                    "Outbox message %s (%s) failed, attempt %d: %r",
+                    message.id,
+                    message.topic,
+                    message.attempts,
+                    exc,
+                )
+        else:
+            delivered += 1
+            db.delete(message)
+
+    db.commit()
+    return delivered, failed
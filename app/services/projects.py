@@ -0,0 +1,48 @@
+import uuid
+from typing import Any, Sequence
+
+import orjson
+from sqlalchemy import Row, Select, select
+
+from app.api.conditional import Validators
+from app.api.schemas.project import ProjectResponse
+from app.core.cache import CachedResponse, cache_key
+from app.models.project import Project
+
+PROJECT_COLUMNS = (Project.id, Project.name, Project.description)
+PROJECT_FIELDS = tuple(ProjectResponse.model_fields)
+
+PROJECT_LIST_CACHE_KEY = cache_key("projects", "list")
+
+
+def project_cache_key(project_id: Any) -> str:
+    # Canonical UUID text so every spelling of an id shares one entry.
+    return cache_key("projects", uuid.UUID(str(project_id)))
+
+
+def project_response(project: Project) -> ProjectResponse:
+    return ProjectResponse(
+        id=str(project.id),
+        name=project.name,
+        description=project.description,
+    )
+
+
+def list_projects_query() -> Select:
+    return select(*PROJECT_COLUMNS).order_by(Project.name)
+
+
+def project_rows(rows: Sequence[Row]) -> list[dict[str, Any]]:
+    return [dict(zip(PROJECT_FIELDS, row)) for row in rows]
+
+
+def project_list_entry(rows: Sequence[Row]) -> CachedResponse:
+    return CachedResponse(orjson.dumps(project_rows(rows)))
+
+
+def project_entry(project: Project) -> CachedResponse:
+    validators = Validators.build(project.updated_at, project.id)
+    return CachedResponse(
+        orjson.dumps(project_response(project).model_dump()),
+        validators.headers(),
+    )
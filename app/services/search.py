@@ -0,0 +1,137 @@
+import re
+
+from sqlalchemy import Select, func, literal, literal_column, select, table, union_all
+from sqlalchemy.orm import Session
+
+from app.models.comment import Comment
+from app.models.enums import IssueStatus
+from app.models.issue import Issue
+
+SEARCH_CONFIG = "english"
+
+# Relative weight of title vs description matches for SQLite's bm25().
+SQLITE_TITLE_WEIGHT = 10.0
+SQLITE_DESCRIPTION_WEIGHT = 1.0
+
+
+def _filtered(
+    query: Select, project_id: str | None, statuses: list[IssueStatus] | None
+) -> Select:
+    if project_id:
+        query = query.where(Issue.project_id == project_id)
+    if statuses:
+        query = query.where(Issue.status.in_(statuses))
+    return query
+
+
+def _postgres_queries(q: str) -> tuple[Select, Select]:
+    tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    issue_vector = literal_column("issues.search_vector")
+    comment_vector = literal_column("comments.search_vector")
+
+    issues = select(
+        literal("issue").label("type"),
+        Issue.id,
+        Issue.id.label("issue_id"),
+        Issue.project_id,
+        Issue.title,
+        func.ts_rank(issue_vector, tsquery).label("rank"),
+    ).where(issue_vector.op("@@")(tsquery))
+
+    comments = (
+        select(
+            literal("comment").label("type"),
+            Comment.id,
+            Comment.issue_id,
+            Issue.project_id,
+            Issue.title,
+            func.ts_rank(comment_vector, tsquery).label("rank"),
+        )
+        .join(Issue, Comment.issue_id == Issue.id)
+        .where(comment_vector.op("@@")(tsquery))
+    )
+    return issues, comments
+
+
+def _fts5_query(q: str) -> str:
+    # Quote every term so user input is never parsed as FTS5 syntax.
+    terms = re.findall(r"\w+", q)
+    return " ".join(f'"{term}"' for term in terms)
+
+
+def _sqlite_queries(q: str) -> tuple[Select, Select]:
+    match = _fts5_query(q)
+    issues_fts = table("issues_fts", literal_column("rowid"))
+    comments_fts = table("comments_fts", literal_column("rowid"))
+
+    issues = (
+        select(
+            literal("issue").label("type"),
+            Issue.id,
+            Issue.id.label("issue_id"),
+            Issue.project_id,
+            Issue.title,
+            (
+                -func.bm25(
+                    literal_column("issues_fts"),
+                    SQLITE_TITLE_WEIGHT,
+                    SQLITE_DESCRIPTION_WEIGHT,
+                )
+            ).label("rank"),
+        )
+        .select_from(issues_fts)
+        .join(Issue, literal_column("issues.rowid") == literal_column("issues_fts.rowid"))
+        .where(literal_column("issues_fts").op("MATCH")(match))
+    )
+
+    comments = (
+        select(
+            literal("comment").label("type"),
+            Comment.id,
+            Comment.issue_id,
+            Issue.project_id,
+            Issue.title,
+            (-func.bm25(literal_column("comments_fts"))).label("rank"),
+        )
+        .select_from(comments_fts)
+        .join(
+            Comment,
+            literal_column("comments.rowid") == literal_column("comments_fts.rowid"),
+        )
+        .join(Issue, Comment.issue_id == Issue.id)
+        .where(literal_column("comments_fts").op("MATCH")(match))
+    )
+    return issues, comments
+
+
+def search(
+    db: Session,
+    q: str,
+    *,
+    project_id: str | None = None,
+    statuses: list[IssueStatus] | None = None,
+    include: str = "all",
+    limit: int,
+    offset: int,
+):
+    if db.get_bind().dialect.name == "sqlite":
+        if not _fts5_query(q):
+            return []
+        issues, comments = _sqlite_queries(q)
+    else:
+        issues, comments = _postgres_queries(q)
+
+    parts = []
+    if include in ("all", "issues"):
+        parts.append(_filtered(issues, project_id, statuses))
+    if include in ("all", "comments"):
+        parts.append(_filtered(comments, project_id, statuses))
+
+    hits = union_all(*parts).subquery() if len(parts) > 1 else parts[0].subquery()
+    query = (
+        select(hits)
+        .order_by(hits.c.rank.desc(), hits.c.id)
+        .limit(limit)
+        .offset(offset)
+    )
+    return db.execute(query).all()
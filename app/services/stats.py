@@ -0,0 +1,115 @@
+import uuid
+from collections import Counter
+from typing import Any, Iterable
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.api.schemas.project import ProjectStats
+from app.models.enums import IssuePriority, IssueStatus
+from app.models.issue import Issue
+from app.models.project_stats import ProjectIssueStats
+
+StatsKey = tuple[uuid.UUID, str, str]
+
+stats_table = ProjectIssueStats.__table__
+
+
+def stats_key(project_id: Any, status: Any, priority: Any) -> StatsKey:
+    return (
+        project_id if isinstance(project_id, uuid.UUID) else uuid.UUID(str(project_id)),
+        IssueStatus(status).value,
+        IssuePriority(priority).value,
+    )
+
+
+def issue_stats_key(issue: Issue) -> StatsKey:
+    return stats_key(issue.project_id, issue.status, issue.priority)
+
+
+def _upsert(dialect: str):
+    dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    stmt = dialect_insert(stats_table)
+    return stmt.on_conflict_do_update(
+        index_elements=[
+            stats_table.c.project_id,
+            stats_table.c.status,
+            stats_table.c.priority,
+        ],
+        set_={"count": stats_table.c.count + stmt.excluded.count},
+    )
+
+
+def adjust_issue_stats(
+    db: Session,
+    removed: Iterable[StatsKey] = (),
+    added: Iterable[StatsKey] = (),
+) -> None:
+    deltas: Counter[StatsKey] = Counter(added)
+    deltas.subtract(removed)
+
+    # A fixed row order keeps concurrent writers from deadlocking on the
+    # counter rows they both touch.
+    rows = [
+        {"project_id": key[0], "status": key[1], "priority": key[2], "count": delta}
+        for key, delta in sorted(deltas.items(), key=lambda item: str(item[0]))
+        if delta
+    ]
+    if rows:
+        db.execute(_upsert(db.get_bind().dialect.name), rows)
+
+
+def clear_project_stats(db: Session, project_id: Any) -> None:
+    db.execute(
+        delete(stats_table).where(stats_table.c.project_id == project_id)
+    )
+
+
+def rebuild_issue_stats(db: Session) -> int:
+    """Recompute every counter from the issues table; returns the row count."""
+    if db.get_bind().dialect.name == "postgresql":
+        # Writers queue behind the rebuild instead of adding deltas to rows
+        # that are about to be replaced.
+        db.execute(text("LOCK TABLE project_issue_stats IN EXCLUSIVE MODE"))
+
+    db.execute(delete(stats_table))
+    counts = select(
+        Issue.project_id, Issue.status, Issue.priority, func.count()
+    ).group_by(Issue.project_id, Issue.status, Issue.priority)
+    result = db.execute(
+        insert(stats_table).from_select(
+            ["project_id", "status", "priority", "count"], counts
+        )
+    )
+    db.commit()
+    return result.rowcount
+
+
+def project_stats_query(project_ids: list[Any]):
+    return select(
+        stats_table.c.project_id,
+        stats_table.c.status,
+        stats_table.c.priority,
+        stats_table.c.count,
+    ).where(stats_table.c.project_id.in_(project_ids))
+
+
+def project_stats(project_ids: list[Any], rows) -> list[ProjectStats]:
+    stats = {
+        str(project_id): ProjectStats(
+            project_id=str(project_id),
+            total=0,
+            by_status=dict.fromkeys((s.value for s in IssueStatus), 0),
+            by_priority=dict.fromkeys((p.value for p in IssuePriority), 0),
+        )
+        for project_id in project_ids
+    }
+
+    for project_id, status, priority, count in rows:
+        entry = stats[str(project_id)]
+        entry.total += count
+        entry.by_status[IssueStatus(status).value] += count
+        entry.by_priority[IssuePriority(priority).value] += count
+
+    return list(stats.values())
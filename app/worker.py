@@ -0,0 +1,84 @@
+"""Background worker that drains the outbox, run next to the API:
+
+    python -m app.worker --processes 2
+
+Workers claim batches with SKIP LOCKED, so any number of them (on any
+number of hosts) can run side by side.
+"""
+import argparse
+import logging
+import multiprocessing
+import signal
+import threading
+
+from app.core.config import settings
+from app.db.session import SessionLocal, engine
+from app.services.outbox import process_batch
+import app.services.notifications  # noqa: F401  (registers handlers)
+
+logger = logging.getLogger("app.worker")
+
+
+def run(stop: threading.Event) -> None:
+    batch_size = settings.OUTBOX_BATCH_SIZE
+    while not stop.is_set():
+        try:
+            with SessionLocal() as db:
+                delivered, failed = process_batch(db, batch_size)
+        except Exception:
+            logger.exception("Outbox batch failed")
+            stop.wait(settings.OUTBOX_POLL_SECONDS)
+            continue
+
+        if delivered or failed:
+            logger.info("Delivered %d, failed %d", delivered, failed)
+        if delivered + failed < batch_size:
+            # Drained for now; a full batch means more is probably waiting.
+            stop.wait(settings.OUTBOX_POLL_SECONDS)
+
+
+def serve() -> None:
+    if multiprocessing.parent_process() is not None:
+        # Connections inherited across fork() must not be shared.
+        engine.dispose(close=False)
+
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+    run(stop)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.worker")
+    parser.add_argument("--processes", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(processName)s %(levelname)s %(message)s",
+    )
+
+    if args.processes <= 1:
+        serve()
+        return
+
+    processes = [
+        multiprocessing.Process(target=serve, name=f"outbox-{n}")
+        for n in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+
+    def shutdown(*_):
+        for process in processes:
+            process.terminate()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    # Ctrl+C already reaches the children through the process group.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for process in processes:
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+"""Load-test the main API endpoints and compare against a stored baseline.
+
+Seeds users, projects, issues and comments with bulk INSERTs, starts the
+API, then drives each endpoint (login, me, list_issues, list_comments,
+update_issue, refresh) at a fixed concurrency and reports p50/p95/p99
+latency and throughput. Runs against ``DATABASE_URL``, or a throwaway
+SQLite file with ``--sqlite``:
+
+    python benchmarks/api_load.py --sqlite --save-baseline baseline.json
+    python benchmarks/api_load.py --sqlite --baseline baseline.json
+
+Before the load runs, the issue detail (with every include) and the
+authenticated issue listing are checked against a fixed SQL statement
+budget, so an N+1 fails the run outright.
+
+With ``--baseline`` the exit status is 1 when any endpoint's p95 or
+throughput is worse than the baseline by more than ``--tolerance``.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import sys
+import tempfile
+import uuid
+from collections import deque
+
+import httpx
+
+from common import print_table, run_load, start_server, unique
+
+PASSWORD = "benchmark-password"
+ENDPOINTS = (
+    "login",
+    "me",
+    "list_issues",
+    "list_comments",
+    "update_issue",
+    "refresh",
+)
+BATCH_SIZE = 5000
+# Statements per request with a cold token cache: the user lookup, then
+# the issue with its joined relations and one comments page; or the
+# listing's version query and its page.
+QUERY_BUDGETS = {
+    "issue_detail": 3,
+    "list_issues": 3,
+}
+
+
+def _insert(db, model, rows: list[dict]) -> None:
+    from sqlalchemy import insert
+
+    for start in range(0, len(rows), BATCH_SIZE):
+        db.execute(insert(model), rows[start:start + BATCH_SIZE])
+
+
+def seed(args) -> dict:
+    from app.core.security import hash_password
+    from app.db.session import Base, SessionLocal, engine
+    from app.models import Comment, Issue, Project, User
+    from app.services.stats import rebuild_issue_stats
+
+    if args.sqlite:
+        Base.metadata.create_all(engine)
+
+    password = hash_password(PASSWORD)
+    run = unique("bench")
+    users = [
+        {
+            "id": uuid.uuid4(),
+            "username": f"{run}-{n}",
+            "email": f"{run}-{n}@example.com",
+            "password": password,
+            "role": "manager",
+        }
+        for n in range(args.users)
+    ]
+    projects = [
+        {
+            "id": uuid.uuid4(),
+            "name": f"{run}-project-{n}",
+            "created_by_id": random.choice(users)["id"],
+        }
+        for n in range(args.projects)
+    ]
+    issues = [
+        {
+            "id": uuid.uuid4(),
+            "title": f"Issue {n}",
+            "description": "Seeded by benchmarks/api_load.py",
+            "priority": random.choice(["low", "medium", "high", "critical"]),
+            "status": random.choice(["open", "in_progress", "closed"]),
+            "project_id": project["id"],
+            "reporter_id": random.choice(users)["id"],
+            "comment_count": args.comments,
+        }
+        for project in projects
+        for n in range(args.issues)
+    ]
+    comments = [
+        {
+            "content": f"Comment {n}",
+            "issue_id": issue["id"],
+            "project_id": issue["project_id"],
+            "author_id": random.choice(users)["id"],
+        }
+        for issue in issues
+        for n in range(args.comments)
+    ]
+
+    with SessionLocal() as db:
+        _insert(db, User, users)
+        _insert(db, Project, projects)
+        _insert(db, Issue, issues)
+        _insert(db, Comment, comments)
+        db.commit()
+        rebuild_issue_stats(db)
+
+    return {
+        "users": [(str(u["id"]), u["email"]) for u in users],
+        "projects": [str(p["id"]) for p in projects],
+        "issues": [str(i["id"]) for i in issues],
+    }
+
+
+def check_query_budgets(data: dict) -> None:
+    from fastapi.testclient import TestClient
+
+    from app.core.jwt import create_access_token
+    from app.core.revocation import revocation_store
+    from app.core.token_cache import token_cache
+    from app.db.query_stats import assert_query_budget
+    from app.db.session import SessionLocal
+    from app.main import app
+
+    # Loaded by hand instead of through the lifespan: the budgets count
+    # every thread's statements, including the background refresh.
+    with SessionLocal() as db:
+        revocation_store.reload(db)
+
+    user_id, _ = data["users"][0]
+    headers = {
+        "Authorization": f"Bearer {create_access_token(user_id, 'manager')}"
+    }
+    requests = {
+        "issue_detail": (f"/api/issues/{data['issues'][0]}", {}),
+        "list_issues": (
+            "/api/issues",
+            {"project_id": data["projects"][0], "limit": 50},
+        ),
+    }
+
+    client = TestClient(app)
+    for name, (path, params) in requests.items():
+        token_cache.clear()
+        with assert_query_budget(QUERY_BUDGETS[name]):
+            response = client.get(path, params=params, headers=headers)
+        response.raise_for_status()
+
+
+async def bench(base_url: str, data: dict, args) -> list[dict]:
+    from app.core.jwt import create_access_token, create_refresh_token
+
+    # Tokens are minted directly so setup doesn't pay for Argon2 logins.
+    access = {
+        user_id: create_access_token(subject=user_id, role="manager")
+        for user_id, _ in data["users"]
+    }
+    refresh_tokens = deque(
+        create_refresh_token(subject=user_id)
+        for user_id, _ in itertools.islice(
+            itertools.cycle(data["users"]), args.concurrency * 2
+        )
+    )
+
+    def auth(user_id: str | None = None) -> dict:
+        user_id = user_id or random.choice(data["users"])[0]
+        return {"Authorization": f"Bearer {access[user_id]}"}
+
+    async def login(c):
+        _, email = random.choice(data["users"])
+        return await c.post(
+            "/api/auth/login", json={"email": email, "password": PASSWORD}
+        )
+
+    async def me(c):
+        return await c.get("/api/auth/me", headers=auth())
+
+    async def list_issues(c):
+        return await c.get(
+            "/api/issues",
+            params={"project_id": random.choice(data["projects"]), "limit": 50},
+            headers=auth(),
+        )
+
+    async def list_comments(c):
+        issue_id = random.choice(data["issues"])
+        return await c.get(f"/api/issues/{issue_id}/comments", headers=auth())
+
+    async def update_issue(c):
+        issue_id = random.choice(data["issues"])
+        return await c.put(
+            f"/api/issues/{issue_id}",
+            json={"title": unique("updated")},
+            headers=auth(),
+        )
+
+    async def refresh(c):
+        # Refresh tokens are single use: each call swaps one for the next.
+        if refresh_tokens:
+            token = refresh_tokens.popleft()
+        else:
+            user_id, _ = random.choice(data["users"])
+            token = create_refresh_token(subject=user_id)
+        response = await c.post(
+            "/api/auth/refresh", headers={"Authorization": f"Bearer {token}"}
+        )
+        if response.status_code == 200:
+            refresh_tokens.append(response.json()["refresh_token"])
+        return response
+
+    requests = {
+        "login": login,
+        "me": me,
+        "list_issues": list_issues,
+        "list_comments": list_comments,
+        "update_issue": update_issue,
+        "refresh": refresh,
+    }
+
+    rows = []
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60
+    ) as client:
+        for name in args.endpoints:
+            result = await run_load(
+                name, client, requests[name], args.concurrency, args.duration
+            )
+            rows.append(result.as_row())
+    return rows
+
+
+def compare(rows: list[dict], baseline: dict, tolerance: float) -> bool:
+    """Print current vs baseline; return False on a regression."""
+    previous = {row["name"]: row for row in baseline["results"]}
+    table, ok = [], True
+    for row in rows:
+        base = previous.get(row["name"])
+        if base is None:
+            continue
+
+        p95_change = _change(row["p95_ms"], base["p95_ms"])
+        rps_change = _change(row["rps"], base["rps"])
+        regressed = p95_change > tolerance or -rps_change > tolerance
+        ok = ok and not regressed
+        table.append(
+            {
+                "name": row["name"],
+                "p50_ms": f"{base['p50_ms']} -> {row['p50_ms']}",
+                "p95_ms": f"{base['p95_ms']} -> {row['p95_ms']}",
+                "p99_ms": f"{base['p99_ms']} -> {row['p99_ms']}",
+                "rps": f"{base['rps']} -> {row['rps']}",
+                "p95_change": f"{p95_change:+.1f}%",
+                "rps_change": f"{rps_change:+.1f}%",
+                "verdict": "REGRESSED" if regressed else "ok",
+            }
+        )
+
+    print("\nAgainst baseline")
+    print_table(table)
+    return ok
+
+
+def _change(current: float, previous: float) -> float:
+    return (current - previous) / previous * 100 if previous else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--issues", type=int, default=500, help="per project")
+    parser.add_argument("--comments", type=int, default=5, help="per issue")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument(
+        "--endpoints", nargs="+", choices=ENDPOINTS, default=list(ENDPOINTS)
+    )
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--async-mode", action="store_true")
+    parser.add_argument(
+        "--sqlite",
+        action="store_true",
+        help="use a throwaway SQLite database instead of DATABASE_URL",
+    )
+    parser.add_argument("--baseline", help="JSON file to compare against")
+    parser.add_argument("--save-baseline", help="write results to this file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=20.0,
+        help="allowed p95/throughput regression in percent",
+    )
+    args = parser.parse_args()
+
+    if args.sqlite:
+        path = os.path.join(tempfile.mkdtemp(), "api_load.sqlite")
+        os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+
+    data = seed(args)
+    try:
+        check_query_budgets(data)
+    except AssertionError as e:
+        sys.exit(f"Query budget exceeded:\n{e}")
+
+    env = {
+        "DATABASE_URL": os.environ["DATABASE_URL"],
+        "DB_ASYNC_MODE": str(args.async_mode).lower(),
+        # Never let a saturated hashing pool turn login results into 503s.
+        "PASSWORD_HASH_QUEUE_DEPTH": str(args.concurrency),
+    }
+    server = start_server(args.port, env)
+    try:
+        rows = asyncio.run(bench(f"http://127.0.0.1:{args.port}", data, args))
+    finally:
+        server.terminate()
+        server.wait()
+
+    print_table(rows)
+
+    meta = {
+        "database": "sqlite" if args.sqlite else "DATABASE_URL",
+        "async_mode": args.async_mode,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "users": args.users,
+        "projects": args.projects,
+        "issues": args.issues,
+        "comments": args.comments,
+    }
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump({"meta": meta, "results": rows}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("meta") != meta:
+            print("\nWarning: baseline was recorded with different settings")
+        if not compare(rows, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
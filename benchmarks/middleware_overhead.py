@@ -0,0 +1,127 @@
+"""Measure what ``RequestMetricsMiddleware`` adds to each request.
+
+Drives in-process ASGI apps with identical requests and no network or
+database in the way, each with and without ``RequestMetricsMiddleware``:
+
+* stub: a bare ASGI callable that sets ``scope["route"]`` the way the
+  router does and sends an empty response, so the middleware is nearly
+  all that runs;
+* fastapi: a FastAPI app with one async ``/api/issues/{issue_id}`` route,
+  for scale against real routing and response handling.
+
+Rounds alternate between the two variants so clock drift on a busy host
+hits both. The difference between the medians is the per-request
+collection cost. Needs no database; ``DATABASE_URL`` defaults to an
+in-memory SQLite URL just so the settings load.
+
+    python benchmarks/middleware_overhead.py --requests 20000
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+import uuid
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from common import print_table  # noqa: E402
+
+
+class _Route:
+    path = "/api/issues/{issue_id}"
+
+
+async def stub_app(scope, receive, send):
+    scope["route"] = _Route
+    await send({"type": "http.response.start", "status": 204, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+def build_app():
+    from fastapi import FastAPI, Response
+
+    app = FastAPI()
+
+    @app.get("/api/issues/{issue_id}")
+    async def get_issue(issue_id: uuid.UUID):
+        return Response(status_code=204)
+
+    return app
+
+
+async def drive(variants: dict, requests: int, rounds: int) -> dict[str, list]:
+    path = f"/api/issues/{uuid.uuid4()}"
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    def scope():
+        return {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"host", b"bench")],
+            "client": ("127.0.0.1", 1),
+            "server": ("bench", 80),
+            "app": None,
+        }
+
+    for asgi in variants.values():  # warm up routing and histogram series
+        for _ in range(requests // 10):
+            await asgi(scope(), receive, send)
+
+    per_request = {name: [] for name in variants}
+    for _ in range(rounds):
+        for name, asgi in variants.items():
+            start = time.perf_counter()
+            for _ in range(requests):
+                await asgi(scope(), receive, send)
+            per_request[name].append((time.perf_counter() - start) / requests)
+    return per_request
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--rounds", type=int, default=15)
+    args = parser.parse_args()
+
+    from app.api.middleware import RequestMetricsMiddleware
+
+    wrapped = build_app()
+    wrapped.add_middleware(RequestMetricsMiddleware)
+    apps = {
+        "stub": (stub_app, RequestMetricsMiddleware(stub_app)),
+        "fastapi": (build_app(), wrapped),
+    }
+
+    rows = []
+    for name, (bare, metrics) in apps.items():
+        timings = asyncio.run(
+            drive({"bare": bare, "metrics": metrics}, args.requests, args.rounds)
+        )
+        medians = {k: statistics.median(v) for k, v in timings.items()}
+        rows.append(
+            {
+                "app": name,
+                "requests": args.requests,
+                "bare_us": round(medians["bare"] * 1e6, 2),
+                "metrics_us": round(medians["metrics"] * 1e6, 2),
+                "overhead_us": round((medians["metrics"] - medians["bare"]) * 1e6, 2),
+            }
+        )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
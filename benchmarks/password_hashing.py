@@ -0,0 +1,76 @@
+"""Measure Argon2 login throughput through the password hashing pool.
+
+Runs ``verify_password_pooled`` from many threads, as the request
+threadpool would, for each pool size and reports logins/sec overall and
+per worker process. No database is needed:
+
+    python benchmarks/password_hashing.py --workers 1 2 4 --seconds 5
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from common import print_table  # noqa: E402
+
+PASSWORD = "benchmark-password"
+
+
+def measure(workers: int, seconds: float, threads: int) -> dict:
+    os.environ["PASSWORD_HASH_WORKERS"] = str(workers)
+    os.environ["PASSWORD_HASH_QUEUE_DEPTH"] = str(threads)
+
+    import importlib
+
+    from app.core import config, security
+
+    importlib.reload(config)
+    security = importlib.reload(security)
+
+    hashed = security.hash_password(PASSWORD)
+    security.verify_password_pooled(PASSWORD, hashed)  # warm up the pool
+
+    deadline = time.perf_counter() + seconds
+    completed = rejected = 0
+
+    def login_loop():
+        nonlocal completed, rejected
+        while time.perf_counter() < deadline:
+            try:
+                security.verify_password_pooled(PASSWORD, hashed)
+                completed += 1
+            except security.PasswordHasherBusy:
+                rejected += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for _ in range(threads):
+            pool.submit(login_loop)
+    elapsed = time.perf_counter() - started
+    security.shutdown_password_pool()
+
+    rate = completed / elapsed
+    return {
+        "workers": workers,
+        "logins": completed,
+        "rejected_503": rejected,
+        "logins_per_sec": round(rate, 1),
+        "per_core": round(rate / max(workers, 1), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--threads", type=int, default=40)
+    args = parser.parse_args()
+
+    rows = [measure(w, args.seconds, args.threads) for w in args.workers]
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Compare the ORM + Pydantic list path with the column-tuple + orjson path.
+
+Seeds a throwaway SQLite database with one project of ``--rows`` issues and
+times building the ``GET /api/issues`` body both ways:
+
+* before: load ``Issue`` entities, build an ``IssueResponse`` per row, then
+  validate and dump the list as FastAPI does for ``response_model``;
+* after: ``list_issues_query`` column tuples zipped into dicts and encoded
+  with orjson (what the route does now).
+
+    python benchmarks/serialization.py --rows 10000
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+import uuid
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "serialization.sqlite")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+
+from common import print_table  # noqa: E402
+
+
+def seed(rows: int) -> uuid.UUID:
+    from app.db.session import Base, SessionLocal, engine
+    from app.models import Issue, Project, User
+
+    Base.metadata.create_all(engine)
+    with SessionLocal() as db:
+        user = User(username="bench", email="bench@example.com", password="x")
+        db.add(user)
+        db.flush()
+        project = Project(name="bench", created_by_id=user.id)
+        db.add(project)
+        db.flush()
+        db.add_all(
+            Issue(
+                title=f"Issue {n}",
+                description="Seeded by benchmarks/serialization.py " * 4,
+                project_id=project.id,
+                reporter_id=user.id,
+            )
+            for n in range(rows)
+        )
+        db.commit()
+        return project.id
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    import orjson
+    from pydantic import TypeAdapter
+
+    from app.api.deps.issues import IssueListParams
+    from app.api.schemas.issue import IssueResponse
+    from app.db.session import SessionLocal
+    from app.models import Issue
+    from app.services.issues import issue_page, issue_response, list_issues_query
+
+    project_id = seed(args.rows)
+    adapter = TypeAdapter(list[IssueResponse])
+    params = IssueListParams(
+        project_id=project_id,
+        status=None,
+        priority=None,
+        assignee_id=None,
+        reporter_id=None,
+        due_after=None,
+        due_before=None,
+        sort="created_at",
+        limit=args.rows,
+        cursor=None,
+    )
+
+    def before():
+        with SessionLocal() as db:
+            issues = (
+                db.query(Issue)
+                .filter(Issue.project_id == project_id)
+                .order_by(Issue.created_at, Issue.id)
+                .all()
+            )
+            body = [issue_response(i) for i in issues]
+            json.dumps(adapter.dump_python(adapter.validate_python(body), mode="json"))
+
+    def after():
+        with SessionLocal() as db:
+            rows = db.execute(list_issues_query(params)).all()
+            orjson.dumps(issue_page(rows, params))
+
+    rows = []
+    for name, fn in (("orm+pydantic", before), ("columns+orjson", after)):
+        elapsed = timed(fn, args.repeat)
+        rows.append(
+            {
+                "path": name,
+                "rows": args.rows,
+                "best_ms": round(elapsed * 1000, 1),
+                "rows_per_sec": round(args.rows / elapsed),
+            }
+        )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
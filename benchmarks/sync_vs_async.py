@@ -0,0 +1,120 @@
+"""Compare request throughput of the sync and async database stacks.
+
+Starts the API twice (``DB_ASYNC_MODE=false`` and ``true``) against the
+database in ``DATABASE_URL``, seeds a manager account with one project of
+issues, then hammers ``GET /api/issues`` and ``GET /api/auth/me`` at each
+concurrency level:
+
+    python benchmarks/sync_vs_async.py --concurrency 50 200 1000
+"""
+import argparse
+import asyncio
+import random
+
+import httpx
+
+from common import print_table, run_load, start_server, unique
+
+PASSWORD = "benchmark-password"
+
+
+def seed(issue_count: int) -> tuple[str, str]:
+    from app.core.security import hash_password
+    from app.db.session import SessionLocal
+    from app.models import Issue, Project, User
+
+    with SessionLocal() as db:
+        user = User(
+            username=unique("bench"),
+            email=f"{unique('bench')}@example.com",
+            password=hash_password(PASSWORD),
+            role="manager",
+        )
+        db.add(user)
+        db.flush()
+
+        project = Project(name=unique("bench-project"), created_by_id=user.id)
+        db.add(project)
+        db.flush()
+
+        db.add_all(
+            Issue(
+                title=f"Issue {n}",
+                description="Seeded by benchmarks/sync_vs_async.py",
+                priority=random.choice(["low", "medium", "high", "critical"]),
+                project_id=project.id,
+                reporter_id=user.id,
+            )
+            for n in range(issue_count)
+        )
+        db.commit()
+
+        return user.email, str(project.id)
+
+
+async def bench_server(base_url, email, project_id, levels, duration):
+    rows = []
+    limits = httpx.Limits(max_connections=max(levels))
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60
+    ) as client:
+        login = await client.post(
+            "/api/auth/login", json={"email": email, "password": PASSWORD}
+        )
+        login.raise_for_status()
+        client.headers["Authorization"] = (
+            f"Bearer {login.json()['access_token']}"
+        )
+
+        async def list_issues(c):
+            return await c.get(
+                "/api/issues", params={"project_id": project_id, "limit": 50}
+            )
+
+        async def me(c):
+            return await c.get("/api/auth/me")
+
+        for concurrency in levels:
+            for name, request in (("list_issues", list_issues), ("me", me)):
+                result = await run_load(
+                    name, client, request, concurrency, duration
+                )
+                rows.append(result.as_row())
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[50, 200, 1000]
+    )
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--issues", type=int, default=500)
+    parser.add_argument("--port", type=int, default=8100)
+    args = parser.parse_args()
+
+    email, project_id = seed(args.issues)
+
+    for offset, mode in enumerate(("false", "true")):
+        port = args.port + offset
+        server = start_server(port, {"DB_ASYNC_MODE": mode})
+        try:
+            rows = asyncio.run(
+                bench_server(
+                    f"http://127.0.0.1:{port}",
+                    email,
+                    project_id,
+                    args.concurrency,
+                    args.duration,
+                )
+            )
+        finally:
+            server.terminate()
+            server.wait()
+
+        print(f"\nDB_ASYNC_MODE={mode}")
+        print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
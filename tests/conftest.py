@@ -0,0 +1,136 @@
+"""Shared fixtures: the app against a throwaway SQLite database.
+
+Settings are read when ``app`` is first imported, so the environment is
+prepared here at module level, before any test module imports it.
+"""
+import os
+import tempfile
+import uuid
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+_workdir = tempfile.mkdtemp(prefix="bugtracker-tests-")
+
+
+def _write_keys() -> tuple[str, str]:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_path = os.path.join(_workdir, "jwt_private.pem")
+    public_path = os.path.join(_workdir, "jwt_public.pem")
+    with open(private_path, "wb") as f:
+        f.write(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+    with open(public_path, "wb") as f:
+        f.write(
+            key.public_key().public_bytes(
+                serialization.Encoding.PEM,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+        )
+    return private_path, public_path
+
+
+_private_key, _public_key = _write_keys()
+os.environ.update(
+    DATABASE_URL=f"sqlite:///{os.path.join(_workdir, 'test.sqlite')}",
+    DB_ASYNC_MODE="false",
+    JWT_PRIVATE_KEY_PATH=_private_key,
+    JWT_PUBLIC_KEY_PATH=_public_key,
+    PASSWORD_HASH_WORKERS="0",
+    ARGON2_TIME_COST="1",
+    ARGON2_MEMORY_COST="1024",
+    ARGON2_PARALLELISM="1",
+)
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.core.jwt import create_access_token  # noqa: E402
+from app.core.revocation import revocation_store  # noqa: E402
+from app.core.token_cache import token_cache  # noqa: E402
+from app.db.session import Base, SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.issue import Issue  # noqa: E402
+from app.models.project import Project  # noqa: E402
+from app.models.user import User  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    Base.metadata.create_all(engine)
+    with SessionLocal() as db:
+        revocation_store.reload(db)
+    yield
+    engine.dispose()
+
+
+@pytest.fixture
+def client():
+    # No lifespan: its background refresh thread would run queries of its
+    # own while a test counts statements.
+    token_cache.clear()
+    return TestClient(app)
+
+
+@pytest.fixture
+def db():
+    with SessionLocal() as session:
+        yield session
+
+
+def _create_user(db, role: str) -> User:
+    name = f"{role}-{uuid.uuid4().hex[:8]}"
+    user = User(
+        username=name,
+        email=f"{name}@example.com",
+        password="not-a-real-hash",
+        role=role,
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def admin(db):
+    return _create_user(db, "admin")
+
+
+@pytest.fixture
+def developer(db):
+    return _create_user(db, "developer")
+
+
+@pytest.fixture
+def auth(admin):
+    token = create_access_token(subject=str(admin.id), role="admin")
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def project(db, admin):
+    project = Project(
+        name=f"project-{uuid.uuid4().hex[:8]}", created_by_id=admin.id
+    )
+    db.add(project)
+    db.commit()
+    return project
+
+
+@pytest.fixture
+def issue(db, admin, project):
+    issue = Issue(
+        title="Crash on save",
+        description="",
+        project_id=project.id,
+        reporter_id=admin.id,
+    )
+    db.add(issue)
+    db.commit()
+    return issue
@@ -0,0 +1,52 @@
+import uuid
+
+from sqlalchemy import select
+
+from app.models.outbox import OutboxMessage
+
+
+def _outbox(db, topic: str, issue_ids: list[str]) -> list[dict]:
+    messages = db.scalars(
+        select(OutboxMessage).where(OutboxMessage.topic == topic)
+    ).all()
+    return [m.payload for m in messages if m.payload["issue_id"] in issue_ids]
+
+
+def test_bulk_create_enqueues_notifications(client, auth, db, project):
+    items = [
+        {"title": f"bulk {n}", "priority": "low", "project_id": str(project.id)}
+        for n in range(3)
+    ]
+    items.append(
+        {"title": "nowhere", "priority": "low", "project_id": str(uuid.uuid4())}
+    )
+
+    response = client.post(
+        "/api/issues/bulk/create", json={"items": items}, headers=auth
+    )
+
+    assert response.status_code == 200
+    created = [r["id"] for r in response.json()["results"] if r["ok"]]
+    assert len(created) == 3
+    payloads = _outbox(db, "issue.created", created)
+    assert sorted(p["issue_id"] for p in payloads) == sorted(created)
+    assert {p["project_id"] for p in payloads} == {str(project.id)}
+
+
+def test_bulk_assign_enqueues_notifications(
+    client, auth, db, issue, developer
+):
+    items = [
+        {"issue_id": str(issue.id), "user_id": str(developer.id)},
+        {"issue_id": str(uuid.uuid4()), "user_id": str(developer.id)},
+    ]
+
+    response = client.post(
+        "/api/issues/bulk/assign", json={"items": items}, headers=auth
+    )
+
+    assert response.status_code == 200
+    assert response.json()["succeeded"] == 1
+    assert _outbox(db, "issue.assigned", [str(issue.id)]) == [
+        {"issue_id": str(issue.id), "assignee_id": str(developer.id)}
+    ]
@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta, timezone
+
+from starlette.requests import Request
+
+from app.api.conditional import Validators
+from app.core.config import settings
+
+
+def _request(**headers: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "headers": [
+                (name.replace("_", "-").encode(), value.encode())
+                for name, value in headers.items()
+            ],
+        }
+    )
+
+
+def test_settled_collection_answers_304():
+    old = datetime.now(tz=timezone.utc) - timedelta(
+        seconds=settings.CHANGES_SETTLE_SECONDS + 60
+    )
+    validators = Validators.for_collection(old, 3, "project_id=1")
+
+    assert "ETag" in validators.headers()
+    assert validators.is_fresh(_request(if_none_match=validators.etag))
+
+
+def test_unsettled_collection_withholds_validators():
+    # A transaction that started before this stamp may still commit a
+    # change that leaves count and max(updated_at) as they are.
+    recent = datetime.now(tz=timezone.utc)
+    validators = Validators.for_collection(recent, 3, "project_id=1")
+
+    assert validators.headers() == {"Cache-Control": "private, no-cache"}
+    assert not validators.is_fresh(_request(if_none_match=validators.etag))
+    assert not validators.is_fresh(_request(if_none_match="*"))
+
+
+def test_empty_collection_is_settled():
+    validators = Validators.for_collection(None, 0, "project_id=1")
+
+    assert "ETag" in validators.headers()
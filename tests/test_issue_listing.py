@@ -0,0 +1,80 @@
+import uuid
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.api.deps.issues import IssueListParams
+from app.models.issue import Issue
+from app.services.issues import list_issues_query
+
+PRIORITIES = ["low", "critical", "medium", "high", "low"]
+
+
+@pytest.fixture
+def issues(db, admin, project):
+    # Created in one transaction, so they all share a created_at second.
+    db.add_all(
+        Issue(
+            title=f"issue {n}",
+            description="",
+            priority=priority,
+            project_id=project.id,
+            reporter_id=admin.id,
+        )
+        for n, priority in enumerate(PRIORITIES)
+    )
+    db.commit()
+
+
+def _all_pages(client, auth, project, sort: str) -> list[dict]:
+    params = {"project_id": str(project.id), "limit": 2, "sort": sort}
+    items, cursor = [], None
+    while True:
+        page = client.get(
+            "/api/issues", params={**params, "cursor": cursor}, headers=auth
+        ).json()
+        items += page["items"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return items
+
+
+@pytest.mark.parametrize(
+    "sort",
+    ["created_at", "-created_at", "updated_at", "-updated_at",
+     "priority", "-priority"],
+)
+def test_pages_cover_every_issue_once(client, auth, project, issues, sort):
+    items = _all_pages(client, auth, project, sort)
+
+    assert sorted(i["title"] for i in items) == [
+        f"issue {n}" for n in range(len(PRIORITIES))
+    ]
+
+
+def test_priority_sorts_by_rank(client, auth, project, issues):
+    items = _all_pages(client, auth, project, "-priority")
+
+    assert [i["priority"] for i in items] == [
+        "critical", "high", "medium", "low", "low"
+    ]
+
+
+def test_priority_uses_native_enum_order_on_postgresql():
+    params = IssueListParams(
+        project_id=str(uuid.uuid4()),
+        status=None,
+        priority=None,
+        assignee_id=None,
+        reporter_id=None,
+        due_after=None,
+        due_before=None,
+        sort="priority",
+        limit=10,
+        cursor=None,
+    )
+
+    sql = str(list_issues_query(params).compile(dialect=postgresql.dialect()))
+
+    assert "CASE" not in sql
+    assert "ORDER BY issues.priority, issues.id" in sql
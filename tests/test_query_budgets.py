@@ -0,0 +1,50 @@
+"""Statement budgets for the hot read paths, so an N+1 fails CI.
+
+The token cache is cleared first, so each budget includes the user lookup
+made while authenticating.
+"""
+from app.db.query_stats import assert_query_budget
+from app.models.comment import Comment
+from app.models.issue import Issue
+
+
+def test_issue_detail_with_every_include(client, auth, db, admin, project, issue):
+    db.add_all(
+        Comment(
+            content=f"comment {n}",
+            issue_id=issue.id,
+            project_id=project.id,
+            author_id=admin.id,
+        )
+        for n in range(5)
+    )
+    db.commit()
+    url = f"/api/issues/{issue.id}"
+
+    # user, issue with its joined relations, one page of comments
+    with assert_query_budget(3):
+        response = client.get(url, headers=auth)
+
+    assert response.status_code == 200
+    assert len(response.json()["comments"]) == 5
+
+
+def test_issue_list(client, auth, db, admin, project):
+    db.add_all(
+        Issue(
+            title=f"issue {n}",
+            description="",
+            project_id=project.id,
+            reporter_id=admin.id,
+        )
+        for n in range(20)
+    )
+    db.commit()
+    params = {"project_id": str(project.id), "limit": 50}
+
+    # user, the listing's version (ETag) query, the page
+    with assert_query_budget(3):
+        response = client.get("/api/issues", params=params, headers=auth)
+
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 20
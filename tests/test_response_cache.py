@@ -0,0 +1,26 @@
+import logging
+
+import pytest
+
+from app.core.cache import warn_if_per_process
+from app.core.config import settings
+
+
+@pytest.mark.parametrize(
+    "backend, workers, warned",
+    [
+        ("memory", 4, True),
+        ("memory", 1, False),
+        ("redis", 4, False),
+    ],
+)
+def test_warns_when_memory_cache_spans_workers(
+    monkeypatch, caplog, backend, workers, warned
+):
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_BACKEND", backend)
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", workers)
+
+    with caplog.at_level(logging.WARNING, logger="app.core.cache"):
+        warn_if_per_process()
+
+    assert ("RESPONSE_CACHE_BACKEND=redis" in caplog.text) is warned
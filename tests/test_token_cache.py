@@ -0,0 +1,33 @@
+import time
+
+import pytest
+
+from app.core import token_cache
+
+
+@pytest.fixture
+def cached(developer):
+    token_cache.token_cache.clear()
+    token = "token-for-" + str(developer.id)
+    token_cache.remember(token, {"exp": time.time() + 300}, developer)
+    return token
+
+
+def test_user_change_invalidates_after_commit(db, developer, cached):
+    developer.is_active = False
+    db.flush()
+    # Other requests still read the committed row; clearing now would let
+    # them re-cache it.
+    assert token_cache.lookup(cached) is not None
+
+    db.commit()
+    assert token_cache.lookup(cached) is None
+
+
+def test_rolled_back_change_keeps_cache(db, developer, cached):
+    developer.is_active = False
+    db.flush()
+    db.rollback()
+
+    assert token_cache.lookup(cached) is not None
+    assert "stale_users" not in db.info